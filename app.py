@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import json
-import math
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -267,7 +266,7 @@ class SimulationApp:
                 continue
             pose = parent.pose.compose(motor.mount_pose)
             start = self._world_to_screen((pose.x, pose.y), viewport, scale)
-            direction = (math.cos(pose.theta), math.sin(pose.theta))
+            direction = pose.rotation
             length = 0.05 + abs(motor.last_command) * 0.1
             end_world = (pose.x + direction[0] * length, pose.y + direction[1] * length)
             end = self._world_to_screen(end_world, viewport, scale)
@@ -754,6 +754,7 @@ class DesignerApp:
             return
 
         self._ensure_robot_defaults()
+        self._push_undo_state()
         default_body = self.body_name or (self.robot_cfg.bodies[0].name if self.robot_cfg.bodies else "body")
         added = 0
         for category, spec in devices:
@@ -1278,6 +1279,7 @@ class DesignerApp:
             self.undo_stack.pop(0)
         self.redo_stack.clear()
         self.robot_dirty = True
+        self.robot_cfg.mark_modified()
 
     def _push_world_undo_state(self) -> None:
         if not self.world_cfg:
@@ -1286,6 +1288,7 @@ class DesignerApp:
         if len(self.world_undo_stack) > 50:
             self.world_undo_stack.pop(0)
         self.world_redo_stack.clear()
+        self.world_cfg.mark_modified()
         if self.active_tab == "environment":
             self.env_dirty = True
         elif self.active_tab == "custom":
@@ -1556,8 +1559,7 @@ class DesignerApp:
             return
         pose = self._body_pose(body_cfg)
         selected: set[int] = set()
-        for idx, pt in enumerate(body_cfg.points):
-            wx, wy = pose.transform_point(pt)
+        for idx, (wx, wy) in enumerate(pose.transform_points(body_cfg.points)):
             if minx <= wx <= maxx and miny <= wy <= maxy:
                 selected.add(idx)
         devices_in_box: list[Tuple[str, str]] = []
@@ -1630,6 +1632,7 @@ class DesignerApp:
         dtype = dtype.lower()
         if not self.robot_cfg:
             return None
+        self.robot_cfg.mark_modified()
         if dtype == "motor":
             name = f"motor_{len(self.robot_cfg.actuators)+1}"
             self.robot_cfg.actuators.append(
@@ -2105,6 +2108,7 @@ class DesignerApp:
             brush_thickness=self.env_brush_thickness,
             shape_tool=self.shape_tool,
         )
+        self.world_cfg.mark_modified()
         name = target_name or self.scenario_name or "untitled_scenario"
         safe = "".join(c for c in name if c.isalnum() or c in ("_", "-")) or "untitled_scenario"
         scenario_path = self.scenario_root / safe
@@ -2905,7 +2909,7 @@ class DesignerApp:
                     (maxx, maxy),
                     (maxx, miny),
                 ]
-                screen_pts = [world_to_screen(body_pose.transform_point(c), self.viewport_rect, self.scale, self.offset, self.view_rotation) for c in corners]
+                screen_pts = [world_to_screen(c, self.viewport_rect, self.scale, self.offset, self.view_rotation) for c in body_pose.transform_points(corners)]
                 pygame.draw.polygon(self.window_surface, self.theme["selection"], screen_pts, 1)
                 handles = self._selection_handles(body_cfg)
                 for rect in handles.values():
@@ -2925,7 +2929,7 @@ class DesignerApp:
             pose = parent.pose.compose(motor.mount_pose)
             start = world_to_screen((pose.x, pose.y), self.viewport_rect, self.scale, self.offset, self.view_rotation)
             length = 0.08
-            dir_vec = (math.cos(pose.theta), math.sin(pose.theta))
+            dir_vec = pose.rotation
             end = world_to_screen(
                 (pose.x + dir_vec[0] * length, pose.y + dir_vec[1] * length), self.viewport_rect, self.scale, self.offset, self.view_rotation
             )
@@ -2968,7 +2972,7 @@ class DesignerApp:
             pygame.draw.circle(self.window_surface, color, base, 4)
             tag = getattr(sensor, "visual_tag", "")
             rng = 0.2 if tag in ("sensor.distance",) else 0.12
-            dir_vec = (math.cos(spose.theta), math.sin(spose.theta))
+            dir_vec = spose.rotation
             end = world_to_screen(
                 (spose.x + dir_vec[0] * rng, spose.y + dir_vec[1] * rng), self.viewport_rect, self.scale, self.offset, self.view_rotation
             )
@@ -19,12 +19,15 @@ from .config import (  # noqa: F401
 from .simulator import Simulator  # noqa: F401
 from .persistence import (  # noqa: F401
     load_scenario,
+    load_scenario_archive,
+    save_scenario_archive,
     list_scenario_summaries,
     list_environment_assets,
     list_robot_assets,
     save_scenario,
     load_snapshot,
     save_snapshot,
+    SnapshotWriter,
     save_robot_design,
     load_robot_design,
     save_environment_design,
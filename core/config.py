@@ -62,6 +62,16 @@ class BodyConfig:
     inertia: float = 1.0
     material: MaterialConfig = field(default_factory=MaterialConfig)
 
+    def __post_init__(self) -> None:
+        # JSON yields nested lists; hold geometry as tuples once so consumers can skip re-coercion.
+        self.points = [(float(x), float(y)) for x, y in self.points]
+        self.edges = [(int(a), int(b)) for a, b in self.edges]
+        if self.pose:
+            x, y, theta = self.pose
+            self.pose = (float(x), float(y), float(theta))
+        else:
+            self.pose = (0.0, 0.0, 0.0)
+
 
 @dataclass
 class JointConfig:
@@ -113,6 +123,13 @@ class RobotConfig:
     measurements: List[MeasurementConfig] = field(default_factory=list)
     controller_module: str = "controller"
 
+    # Fingerprint recorded by the persistence normalizer; a plain class attribute so it never reaches JSON.
+    _normalized = None
+
+    def mark_modified(self) -> None:
+        """Force the next save to re-run normalization after an in-place edit."""
+        self._normalized = None
+
 
 @dataclass
 class ScenarioRobotRef:
@@ -215,6 +232,13 @@ class WorldConfig:
     custom_objects: List[CustomObjectConfig] = field(default_factory=list)
     designer_state: DesignerState = field(default_factory=DesignerState)
 
+    # Fingerprint recorded by the persistence normalizer; a plain class attribute so it never reaches JSON.
+    _normalized = None
+
+    def mark_modified(self) -> None:
+        """Force the next save to re-run normalization after an in-place edit."""
+        self._normalized = None
+
 
 @dataclass
 class SnapshotState:
@@ -251,12 +275,22 @@ def _dataclass_from_dict(cls, data: Dict) -> object:
 
 
 def load_json(path: Path, cls):
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
-    return _dataclass_from_dict(cls, data)
+    # One read into bytes; json.loads detects UTF-8 itself, skipping the text-wrapper decode pass.
+    return loads_json(path.read_bytes(), cls)
+
+
+def loads_json(raw: bytes | str, cls):
+    """Like load_json, for content already in memory (e.g. an archive member)."""
+    return _dataclass_from_dict(cls, json.loads(raw))
 
 
 def save_json(path: Path, obj) -> None:
+    write_text_if_changed(path, dumps_json(obj))
+
+
+def dumps_json(obj) -> str:
+    """Serialize a config dataclass to the same indented JSON text save_json writes."""
+
     def _encode(o):
         if hasattr(o, "__dataclass_fields__"):
             return {k: _encode(v) for k, v in asdict(o).items()}
@@ -266,7 +300,18 @@ def save_json(path: Path, obj) -> None:
             return {k: _encode(v) for k, v in o.items()}
         return o
 
+    return json.dumps(_encode(obj), indent=2)
+
+
+def write_text_if_changed(path: Path, text: str) -> bool:
+    """Write ``text`` unless the file already holds exactly these bytes. Returns True when written."""
+    data = text.encode("utf-8")
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(_encode(obj), f, indent=2)
+    path.write_bytes(data)
+    return True
 
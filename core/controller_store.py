@@ -15,6 +15,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from .config import write_text_if_changed
+
 
 CONTROLLER_DIRNAME = "controllers"
 CONTROLLER_SUFFIX = ".controller.json"
@@ -217,7 +219,8 @@ def ensure_compiled_controller(base: Path, module_name: str) -> Tuple[Optional[P
         out_dir = base / GENERATED_DIRNAME
         out_dir.mkdir(parents=True, exist_ok=True)
         py_path = out_dir / f"{module_name}.py"
-        py_path.write_text(code, encoding="utf-8")
+        # Leave an identical module untouched so its mtime (and the simulator's code cache) stays valid.
+        write_text_if_changed(py_path, code)
         return py_path, out_dir
     legacy_path = base / f"{module_name}.py"
     if legacy_path.exists():
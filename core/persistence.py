@@ -1,8 +1,14 @@
 """File I/O helpers for scenarios and snapshots."""
 from __future__ import annotations
 
+from array import array
+import base64
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import json
+import os
+import time
+import zipfile
 from typing import Dict, Tuple, List, Optional
 
 from .config import (
@@ -20,14 +26,28 @@ from .config import (
     ScenarioLoadResult,
     ScenarioSummary,
     load_json,
+    loads_json,
     save_json,
+    dumps_json,
+    write_text_if_changed,
 )
 
 
+SCENARIO_ARCHIVE_SUFFIX = ".scnz"
+
+
+_MISSING = object()
+
+
 def _resolve_asset(base: Path, ref: str) -> Path:
     """Resolve an asset reference relative to the scenario folder or repository root."""
     if not ref:
         return base
+    # Fast path: a bare filename beside the scenario needs no per-component resolve().
+    if "/" not in ref and "\\" not in ref and ".." not in ref:
+        candidate_str = os.path.join(base, ref)
+        if os.path.exists(candidate_str):
+            return Path(os.path.abspath(candidate_str))
     ref_path = Path(ref)
     if ref_path.is_absolute():
         return ref_path
@@ -45,6 +65,11 @@ def _resolve_asset(base: Path, ref: str) -> Path:
 
 
 def _coerce_pose(value) -> Tuple[float, float, float]:
+    # Fast path: already a 3-tuple of floats (exact type checks are cheaper than isinstance/float()).
+    if type(value) is tuple and len(value) == 3:
+        x, y, theta = value
+        if type(x) is float and type(y) is float and type(theta) is float:
+            return value
     if not value:
         return (0.0, 0.0, 0.0)
     if isinstance(value, (list, tuple)) and len(value) == 3:
@@ -61,13 +86,13 @@ def _parse_robot_refs(data: dict, default_robot_ref: Optional[str]) -> List[Scen
             if not ref:
                 continue
             ident = entry.get("id") or entry.get("name") or f"robot_{idx+1}"
-            spawn_provided = False
-            spawn_val = None
-            for key in ("spawn_pose", "spawn", "pose"):
-                if key in entry:
-                    spawn_provided = True
-                    spawn_val = entry.get(key)
-                    break
+            # First present key wins, even if its value is falsy (an explicit null still counts as provided).
+            spawn_val = entry.get("spawn_pose", _MISSING)
+            if spawn_val is _MISSING:
+                spawn_val = entry.get("spawn", _MISSING)
+                if spawn_val is _MISSING:
+                    spawn_val = entry.get("pose", _MISSING)
+            spawn_provided = spawn_val is not _MISSING
             spawn = _coerce_pose(spawn_val) if spawn_provided else (0.0, 0.0, 0.0)
             refs.append(
                 ScenarioRobotRef(
@@ -77,7 +102,7 @@ def _parse_robot_refs(data: dict, default_robot_ref: Optional[str]) -> List[Scen
                     spawn_provided=spawn_provided,
                     controller=entry.get("controller"),
                     role=entry.get("role"),
-                    metadata=dict(entry.get("metadata") or {}),
+                    metadata=entry.get("metadata") or {},
                 )
             )
     elif default_robot_ref:
@@ -101,39 +126,45 @@ def load_scenario_descriptor(path: Path) -> ScenarioDescriptor:
     if descriptor_path.exists():
         with descriptor_path.open("r", encoding="utf-8") as f:
             data = json.load(f)
-        env_ref = data.get("environment") or data.get("env")
-        robot_ref = data.get("robot")
-        if not env_ref:
-            raise ValueError(f"scenario.json missing 'environment': {descriptor_path}")
-        robots = _parse_robot_refs(data, robot_ref)
-        if not robots:
-            raise ValueError(f"scenario.json missing 'robot' or 'robots' entries: {descriptor_path}")
-        ident = data.get("id") or path.name
-        name = data.get("name") or ident
-        return ScenarioDescriptor(
-            id=str(ident),
-            name=str(name),
-            environment=str(env_ref),
-            robots=robots,
-            description=data.get("description"),
-            thumbnail=data.get("thumbnail"),
-            help=data.get("help"),
-            seed=data.get("seed"),
-            metadata=dict(data.get("metadata") or {}),
-        )
+        return _descriptor_from_data(data, path.name, descriptor_path)
 
     # Legacy world/robot pair fallback
     world_file = path / "world.json"
     robot_file = path / "robot.json"
     if not (world_file.exists() and robot_file.exists()):
         raise FileNotFoundError(f"No scenario.json or world/robot pair found under {path}")
-    ident = path.name
-    robot_ref = robot_file.name
-    robots = _parse_robot_refs({"controller": None}, robot_ref)
+    return _legacy_descriptor(path.name)
+
+
+def _descriptor_from_data(data: dict, default_id: str, source: Path) -> ScenarioDescriptor:
+    env_ref = data.get("environment") or data.get("env")
+    robot_ref = data.get("robot")
+    if not env_ref:
+        raise ValueError(f"scenario.json missing 'environment': {source}")
+    robots = _parse_robot_refs(data, robot_ref)
+    if not robots:
+        raise ValueError(f"scenario.json missing 'robot' or 'robots' entries: {source}")
+    ident = data.get("id") or default_id
+    name = data.get("name") or ident
+    return ScenarioDescriptor(
+        id=str(ident),
+        name=str(name),
+        environment=str(env_ref),
+        robots=robots,
+        description=data.get("description"),
+        thumbnail=data.get("thumbnail"),
+        help=data.get("help"),
+        seed=data.get("seed"),
+        metadata=data.get("metadata") or {},
+    )
+
+
+def _legacy_descriptor(ident: str) -> ScenarioDescriptor:
+    robots = _parse_robot_refs({"controller": None}, "robot.json")
     return ScenarioDescriptor(
         id=str(ident),
         name=str(ident),
-        environment=world_file.name,
+        environment="world.json",
         robots=robots,
         description=None,
         thumbnail=None,
@@ -160,27 +191,49 @@ def load_scenario_summary(path: Path) -> dict:
     )
 
 
+# Sorted asset listings keyed by directory; invalidated when the directory mtime changes.
+_asset_list_cache: Dict[Path, Tuple[int, List[Path]]] = {}
+# Directory mtimes have coarse granularity; skip caching listings that were modified very recently.
+_RACY_MTIME_WINDOW_NS = 1_000_000_000
+
+
+def _list_json_files(folder: Path) -> List[Path]:
+    """Return sorted *.json files under a folder, cached on the directory mtime."""
+    try:
+        st = os.stat(folder)
+    except OSError:
+        _asset_list_cache.pop(folder, None)
+        return []
+    cached = _asset_list_cache.get(folder)
+    if cached is not None and cached[0] == st.st_mtime_ns:
+        return list(cached[1])
+    try:
+        with os.scandir(folder) as it:
+            files = sorted(folder / entry.name for entry in it if entry.name.endswith(".json") and entry.is_file())
+    except OSError:
+        return []
+    if time.time_ns() - st.st_mtime_ns > _RACY_MTIME_WINDOW_NS:
+        _asset_list_cache[folder] = (st.st_mtime_ns, files)
+    else:
+        _asset_list_cache.pop(folder, None)
+    return list(files)
+
+
 def list_environment_assets(base: Path) -> List[Path]:
     """List available environment JSON assets under assets/environments."""
-    env_dir = base / "assets" / "environments"
-    if not env_dir.exists():
-        return []
-    return sorted(p for p in env_dir.glob("*.json") if p.is_file())
+    return _list_json_files(base / "assets" / "environments")
 
 
 def list_robot_assets(base: Path) -> List[Path]:
     """List available robot JSON assets under assets/robots."""
-    robot_dir = base / "assets" / "robots"
-    if not robot_dir.exists():
-        return []
-    return sorted(p for p in robot_dir.glob("*.json") if p.is_file())
+    return _list_json_files(base / "assets" / "robots")
 
 
 def list_scenario_summaries(base: Path) -> List[ScenarioSummary]:
     """Return shallow summaries for all detectable scenarios under a folder."""
     if not base.exists():
         return []
-    summaries: List[ScenarioSummary] = []
+    candidates: List[Path] = []
     for entry in base.iterdir():
         if not entry.is_dir():
             continue
@@ -188,15 +241,26 @@ def list_scenario_summaries(base: Path) -> List[ScenarioSummary]:
         has_descriptor = (entry / "scenario.json").exists()
         if not (has_pair or has_descriptor):
             continue
-        try:
-            summaries.append(load_scenario_summary(entry))
-        except Exception:
-            continue
+        candidates.append(entry)
+    summaries: List[ScenarioSummary] = []
+    if not candidates:
+        return summaries
+    # Descriptor reads are I/O bound; overlap them on a small pool. Broken scenarios are skipped as before.
+    workers = min(8, os.cpu_count() or 4, len(candidates))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(load_scenario_summary, entry) for entry in candidates]
+        for future in as_completed(futures):
+            try:
+                summaries.append(future.result())
+            except Exception:
+                continue
     return sorted(summaries, key=lambda s: s.id)
 
 
 def load_scenario(path: Path, *, spawn_overrides: Optional[Dict[str, Tuple[float, float, float]]] = None) -> ScenarioLoadResult:
     """Load a scenario descriptor plus its environment/robots."""
+    if path.suffix == SCENARIO_ARCHIVE_SUFFIX:
+        return load_scenario_archive(path, spawn_overrides=spawn_overrides)
     descriptor = load_scenario_descriptor(path)
     env_path = _resolve_asset(path, descriptor.environment)
     world_cfg = load_environment_design(env_path)
@@ -206,29 +270,7 @@ def load_scenario(path: Path, *, spawn_overrides: Optional[Dict[str, Tuple[float
     for idx, ref in enumerate(descriptor.robots):
         robot_path = _resolve_asset(path, ref.ref)
         robot_cfg = load_robot_design(robot_path)
-        override_pose = spawn_overrides.get(ref.id) if spawn_overrides else None
-        if override_pose is not None:
-            spawn_pose = _coerce_pose(override_pose)
-        elif getattr(ref, "spawn_provided", False):
-            spawn_pose = _coerce_pose(getattr(ref, "spawn_pose", (0.0, 0.0, 0.0)))
-        else:
-            # Fall back to the robot asset's own spawn if the descriptor omitted one.
-            spawn_pose = _coerce_pose(getattr(robot_cfg, "spawn_pose", (0.0, 0.0, 0.0)))
-        robot_cfg.spawn_pose = spawn_pose
-        controller_module = ref.controller or getattr(robot_cfg, "controller_module", None) or "controller"
-        robot_cfg.controller_module = controller_module
-        _normalize_robot(robot_cfg)
-        robots.append(
-            ScenarioRobot(
-                id=ref.id or f"robot_{idx+1}",
-                config=robot_cfg,
-                spawn_pose=spawn_pose,
-                controller=controller_module,
-                role=ref.role,
-                metadata=ref.metadata,
-                path=robot_path,
-            )
-        )
+        robots.append(_scenario_robot(idx, ref, robot_cfg, robot_path, spawn_overrides))
     if not robots:
         # Should not happen, but guard for safety
         robot_cfg = load_robot_design(path / "robot.json")
@@ -247,6 +289,92 @@ def load_scenario(path: Path, *, spawn_overrides: Optional[Dict[str, Tuple[float
     return ScenarioLoadResult(descriptor=descriptor, world=world_cfg, robots=robots, scenario_path=path)
 
 
+def _scenario_robot(
+    idx: int,
+    ref: ScenarioRobotRef,
+    robot_cfg: RobotConfig,
+    robot_path: Path,
+    spawn_overrides: Optional[Dict[str, Tuple[float, float, float]]],
+) -> ScenarioRobot:
+    """Apply descriptor spawn/controller settings to a loaded robot asset."""
+    override_pose = spawn_overrides.get(ref.id) if spawn_overrides else None
+    if override_pose is not None:
+        spawn_pose = _coerce_pose(override_pose)
+    elif getattr(ref, "spawn_provided", False):
+        spawn_pose = _coerce_pose(getattr(ref, "spawn_pose", (0.0, 0.0, 0.0)))
+    else:
+        # Fall back to the robot asset's own spawn if the descriptor omitted one.
+        spawn_pose = _coerce_pose(getattr(robot_cfg, "spawn_pose", (0.0, 0.0, 0.0)))
+    robot_cfg.spawn_pose = spawn_pose
+    controller_module = ref.controller or getattr(robot_cfg, "controller_module", None) or "controller"
+    robot_cfg.controller_module = controller_module
+    robot_cfg.mark_modified()
+    _normalize_robot(robot_cfg)
+    return ScenarioRobot(
+        id=ref.id or f"robot_{idx+1}",
+        config=robot_cfg,
+        spawn_pose=spawn_pose,
+        controller=controller_module,
+        role=ref.role,
+        metadata=ref.metadata,
+        path=robot_path,
+    )
+
+
+def _archive_member(members: Dict[str, bytes], ref: str, archive: Path) -> str:
+    """Map a descriptor reference onto an archive member name (exact path first, then basename)."""
+    name = ref.replace("\\", "/")
+    # Strip whole "./" and "/" prefixes only; a dot-named directory such as ".assets/" must survive.
+    while name.startswith(("./", "/")):
+        name = name[2:] if name.startswith("./") else name[1:]
+    if name in members:
+        return name
+    base = name.rsplit("/", 1)[-1]
+    if base in members:
+        return base
+    raise FileNotFoundError(f"{ref!r} not found in scenario archive {archive}")
+
+
+def load_scenario_archive(
+    path: Path, *, spawn_overrides: Optional[Dict[str, Tuple[float, float, float]]] = None
+) -> ScenarioLoadResult:
+    """Load a scenario packed into a single ``.scnz`` zip (scenario.json optional, like a folder)."""
+    with zipfile.ZipFile(path) as zf:
+        members = {name: zf.read(name) for name in zf.namelist() if not name.endswith("/")}
+    ident = path.stem
+    if "scenario.json" in members:
+        descriptor = _descriptor_from_data(json.loads(members["scenario.json"]), ident, path)
+    elif "world.json" in members and "robot.json" in members:
+        descriptor = _legacy_descriptor(ident)
+    else:
+        raise FileNotFoundError(f"No scenario.json or world/robot pair found in {path}")
+    world_cfg = loads_json(members[_archive_member(members, descriptor.environment, path)], WorldConfig)
+    if descriptor.seed is not None and getattr(world_cfg, "seed", None) is None:
+        world_cfg.seed = descriptor.seed
+    robots: List[ScenarioRobot] = []
+    for idx, ref in enumerate(descriptor.robots):
+        member = _archive_member(members, ref.ref, path)
+        robot_cfg = loads_json(members[member], RobotConfig)
+        robots.append(_scenario_robot(idx, ref, robot_cfg, path / member, spawn_overrides))
+    return ScenarioLoadResult(descriptor=descriptor, world=world_cfg, robots=robots, scenario_path=path)
+
+
+def save_scenario_archive(path: Path, world_cfg: WorldConfig, robot_cfg: RobotConfig) -> None:
+    """Write world/robot into a ``.scnz`` zip, swapping it into place atomically."""
+    _normalize_world(world_cfg)
+    _normalize_robot(robot_cfg)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("world.json", dumps_json(world_cfg))
+            zf.writestr("robot.json", dumps_json(robot_cfg))
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
 def save_scenario(path: Path, world_cfg: WorldConfig, robot_cfg: RobotConfig) -> None:
     _normalize_world(world_cfg)
     _normalize_robot(robot_cfg)
@@ -254,19 +382,73 @@ def save_scenario(path: Path, world_cfg: WorldConfig, robot_cfg: RobotConfig) ->
     save_json(path / "robot.json", robot_cfg)
 
 
-def save_snapshot(path: Path, snap: SnapshotState) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(
-            {
-                "time": snap.time,
-                "step": snap.step,
-                "bodies": snap.bodies,
-                "controller_state": snap.controller_state,
-            },
-            f,
-            indent=2,
-        )
+class SnapshotWriter:
+    """Writes snapshots through one reusable payload dict; suited to periodic snapshot loops.
+
+    Output is compact JSON unless ``indent`` is set (handy when inspecting snapshots by hand).
+    """
+
+    def __init__(self, *, indent: bool = False) -> None:
+        self.indent = indent
+        self._buf: Dict[str, object] = {"time": 0.0, "step": 0, "bodies": None, "controller_state": None}
+
+    def write(self, path: Path, snap: SnapshotState) -> None:
+        buf = self._buf
+        buf["time"] = snap.time
+        buf["step"] = snap.step
+        buf["bodies"] = snap.bodies
+        buf["controller_state"], binary = _split_binary_state(snap.controller_state)
+        if binary:
+            buf["controller_state_b64"] = binary
+        try:
+            if self.indent:
+                text = json.dumps(buf, indent=2)
+            else:
+                text = json.dumps(buf, separators=(",", ":"))
+            write_text_if_changed(path, text)
+        finally:
+            # Drop references so the writer does not pin the last snapshot's data.
+            buf["bodies"] = None
+            buf["controller_state"] = None
+            buf.pop("controller_state_b64", None)
+
+
+def _split_binary_state(state):
+    """Pull bytes/array values out of a controller state dict as base64 so dense buffers stay compact.
+
+    Returns ``(json_state, binary)``; ``binary`` maps key -> {"typecode", "data"} and is empty for plain states.
+    """
+    if not isinstance(state, dict):
+        return state, {}
+    binary: Dict[str, Dict[str, Optional[str]]] = {}
+    for key, value in state.items():
+        if isinstance(value, (bytes, bytearray)):
+            binary[key] = {"typecode": None, "data": base64.b64encode(value).decode("ascii")}
+        elif isinstance(value, array):
+            binary[key] = {"typecode": value.typecode, "data": base64.b64encode(value.tobytes()).decode("ascii")}
+    if not binary:
+        return state, binary
+    return {k: v for k, v in state.items() if k not in binary}, binary
+
+
+def _merge_binary_state(state, binary):
+    if not binary:
+        return state
+    merged = dict(state or {})
+    for key, entry in binary.items():
+        raw = base64.b64decode(entry["data"])
+        typecode = entry.get("typecode")
+        if typecode:
+            values = array(typecode)
+            values.frombytes(raw)
+            merged[key] = values
+        else:
+            merged[key] = raw
+    return merged
+
+
+def save_snapshot(path: Path, snap: SnapshotState, *, indent: bool = False) -> None:
+    SnapshotWriter(indent=indent).write(path, snap)
 
 
 def load_snapshot(path: Path) -> SnapshotState:
@@ -276,12 +458,106 @@ def load_snapshot(path: Path) -> SnapshotState:
         time=data.get("time", 0.0),
         step=data.get("step", 0),
         bodies=data.get("bodies", {}),
-        controller_state=data.get("controller_state"),
+        controller_state=_merge_binary_state(data.get("controller_state"), data.get("controller_state_b64")),
+    )
+
+
+def _normalize_body(body: BodyConfig) -> BodyConfig:
+    """Return a copy of a static body with plain float/int geometry.
+
+    BodyConfig.__post_init__ rebuilds points/edges as fresh float/int tuple lists, so they are passed through.
+    BodyConfig always defines can_move/mass/inertia, so fields are read directly rather than via getattr.
+    """
+    return BodyConfig(
+        name=str(body.name),
+        points=body.points,
+        edges=body.edges,
+        pose=_coerce_pose(body.pose),
+        can_move=bool(body.can_move),
+        mass=float(body.mass),
+        inertia=float(body.inertia),
+        material=body.material,  # already dataclass
+    )
+
+
+def _is_sorted_by_name(items: list) -> bool:
+    return all(items[i].name <= items[i + 1].name for i in range(len(items) - 1))
+
+
+def _sorted_by_name(items: list) -> list:
+    """Stable sort by ``.name`` using decorated tuples; the index breaks ties before objects are compared.
+
+    Already-ordered input (the usual case on re-save) is returned as-is without decorating.
+    """
+    if _is_sorted_by_name(items):
+        return items
+    decorated = [(item.name, idx, item) for idx, item in enumerate(items)]
+    decorated.sort()
+    return [item for _, _, item in decorated]
+
+
+def _body_fingerprint(body: BodyConfig) -> Tuple[object, ...]:
+    return (
+        body,
+        body.name,
+        tuple(body.points),
+        tuple(body.edges),
+        body.pose,
+        body.can_move,
+        body.mass,
+        body.inertia,
+        body.material,
+    )
+
+
+def _world_fingerprint(world_cfg: WorldConfig) -> Tuple[object, ...]:
+    """Summary of every value ``_normalize_world`` sorts on or coerces, geometry included.
+
+    Points are copied into tuples so in-place edits (``d.points[i] = ...``) change it; items and
+    unchanged point tuples still compare by identity first, so the check stays a linear scan.
+    """
+    bounds = getattr(world_cfg, "bounds", None)
+    ds = getattr(world_cfg, "designer_state", None)
+    return (
+        None if bounds is None else (bounds.min_x, bounds.min_y, bounds.max_x, bounds.max_y),
+        tuple((d, d.kind, d.thickness, tuple(d.points), d.color) for d in getattr(world_cfg, "drawings", None) or ()),
+        tuple(
+            (o, o.name, o.body and _body_fingerprint(o.body))
+            for o in getattr(world_cfg, "shape_objects", None) or ()
+        ),
+        tuple(
+            (o, o.name, o.kind, o.body and _body_fingerprint(o.body))
+            for o in getattr(world_cfg, "custom_objects", None) or ()
+        ),
+        None
+        if ds is None
+        else (
+            ds,
+            getattr(ds, "brush_thickness", None),
+            getattr(ds, "brush_kind", None),
+            getattr(ds, "shape_tool", None),
+            getattr(ds, "creation_context", None),
+        ),
+    )
+
+
+def _robot_fingerprint(robot_cfg: RobotConfig) -> Tuple[object, ...]:
+    """Names, in order, of everything ``_normalize_robot`` sorts."""
+    return (
+        tuple(item.name for item in getattr(robot_cfg, "bodies", None) or ()),
+        tuple(item.name for item in robot_cfg.actuators),
+        tuple(item.name for item in robot_cfg.sensors),
     )
 
 
 def _normalize_world(world_cfg: WorldConfig) -> None:
-    """Ensure world config fields stay deterministic when saving."""
+    """Ensure world config fields stay deterministic when saving.
+
+    Skipped while the config still matches the fingerprint taken at the last normalization, so an edit
+    that forgot ``mark_modified`` is still re-normalized.
+    """
+    if world_cfg._normalized is not None and world_cfg._normalized == _world_fingerprint(world_cfg):
+        return
     # Normalize bounds ordering
     if getattr(world_cfg, "bounds", None):
         b = world_cfg.bounds
@@ -293,75 +569,46 @@ def _normalize_world(world_cfg: WorldConfig) -> None:
         world_cfg.bounds = EnvironmentBounds(min_x=min_x, min_y=min_y, max_x=max_x, max_y=max_y)
     # Normalize drawings (sort + clamp small negative thickness)
     drawings = getattr(world_cfg, "drawings", []) or []
-    normalized = []
-    for d in drawings:
-        pts = [(float(p[0]), float(p[1])) for p in d.points]
-        normalized.append(
-            type(d)(
-                kind=str(getattr(d, "kind", "mark")),
-                thickness=max(1e-4, float(getattr(d, "thickness", 0.05))),
-                points=pts,
-                color=tuple(getattr(d, "color", (140, 180, 240))),
-            )
+    # Decorate each stroke with its sort key once: (kind, thickness, point count, flattened rounded coords).
+    # Flattening keeps the same ordering as comparing per-point tuples since point counts already match.
+    decorated = []
+    for idx, d in enumerate(drawings):
+        pts = [(float(x), float(y)) for x, y in d.points]
+        stroke = type(d)(
+            kind=str(d.kind),
+            thickness=max(1e-4, float(d.thickness)),
+            points=pts,
+            color=tuple(d.color),
         )
-    world_cfg.drawings = sorted(
-        normalized,
-        key=lambda s: (
-            s.kind,
-            round(s.thickness, 6),
-            len(s.points),
-            [(round(p[0], 6), round(p[1], 6)) for p in s.points],
-        ),
-    )
+        coords = tuple(round(v, 6) for pt in pts for v in pt)
+        decorated.append(((stroke.kind, round(stroke.thickness, 6), len(pts), coords), idx, stroke))
+    decorated.sort()
+    world_cfg.drawings = [stroke for _, _, stroke in decorated]
     # Normalize shape objects (static or decorative geometry)
     shape_objects = getattr(world_cfg, "shape_objects", []) or []
     norm_shapes: list[WorldObjectConfig] = []
     for obj in shape_objects:
-        body = getattr(obj, "body", None)
+        body = obj.body
         if not body:
             continue
-        pts = [(float(p[0]), float(p[1])) for p in body.points]
-        edges = [(int(a), int(b)) for a, b in body.edges]
-        norm_body = BodyConfig(
-            name=str(body.name),
-            points=pts,
-            edges=edges,
-            pose=tuple(float(v) for v in body.pose),
-            can_move=bool(getattr(body, "can_move", False)),
-            mass=float(getattr(body, "mass", 1.0)),
-            inertia=float(getattr(body, "inertia", 1.0)),
-            material=body.material,  # already dataclass
-        )
-        norm_shapes.append(WorldObjectConfig(name=str(obj.name), body=norm_body))
-    world_cfg.shape_objects = sorted(norm_shapes, key=lambda o: o.name)
+        norm_shapes.append(WorldObjectConfig(name=str(obj.name), body=_normalize_body(body)))
+    world_cfg.shape_objects = _sorted_by_name(norm_shapes)
     # Normalize custom objects (metadata + geometry)
     custom_objects = getattr(world_cfg, "custom_objects", []) or []
     norm_customs: list[CustomObjectConfig] = []
     for obj in custom_objects:
-        body = getattr(obj, "body", None)
+        body = obj.body
         if not body:
             continue
-        pts = [(float(p[0]), float(p[1])) for p in body.points]
-        edges = [(int(a), int(b)) for a, b in body.edges]
-        norm_body = BodyConfig(
-            name=str(body.name),
-            points=pts,
-            edges=edges,
-            pose=tuple(float(v) for v in body.pose),
-            can_move=bool(getattr(body, "can_move", False)),
-            mass=float(getattr(body, "mass", 1.0)),
-            inertia=float(getattr(body, "inertia", 1.0)),
-            material=body.material,
-        )
         norm_customs.append(
             CustomObjectConfig(
-                name=str(getattr(obj, "name", body.name)),
-                body=norm_body,
-                kind=str(getattr(obj, "kind", "custom")),
-                metadata=dict(getattr(obj, "metadata", {}) or {}),
+                name=str(obj.name),
+                body=_normalize_body(body),
+                kind=str(obj.kind),
+                metadata=dict(obj.metadata or {}),
             )
         )
-    world_cfg.custom_objects = sorted(norm_customs, key=lambda o: o.name)
+    world_cfg.custom_objects = _sorted_by_name(norm_customs)
     # Normalize designer state to keep numeric values stable
     ds = getattr(world_cfg, "designer_state", None) or DesignerState()
     ds.brush_thickness = max(1e-4, float(getattr(ds, "brush_thickness", 0.05)))
@@ -372,10 +619,13 @@ def _normalize_world(world_cfg: WorldConfig) -> None:
     if getattr(ds, "creation_context", "") not in ("robot", "environment", "custom"):
         ds.creation_context = "robot"
     world_cfg.designer_state = ds
+    world_cfg._normalized = _world_fingerprint(world_cfg)
 
 
 def _normalize_robot(robot_cfg: RobotConfig) -> None:
     """Keep device ordering stable for deterministic saves."""
+    if robot_cfg._normalized is not None and robot_cfg._normalized == _robot_fingerprint(robot_cfg):
+        return
     # Ensure at least one body exists to avoid downstream None crashes.
     if not getattr(robot_cfg, "bodies", None):
         robot_cfg.bodies = [
@@ -387,9 +637,10 @@ def _normalize_robot(robot_cfg: RobotConfig) -> None:
                 can_move=True,
             )
         ]
-    robot_cfg.actuators = sorted(robot_cfg.actuators, key=lambda a: a.name)
-    robot_cfg.sensors = sorted(robot_cfg.sensors, key=lambda s: s.name)
-    robot_cfg.bodies = sorted(robot_cfg.bodies, key=lambda b: b.name)
+    robot_cfg.actuators = _sorted_by_name(robot_cfg.actuators)
+    robot_cfg.sensors = _sorted_by_name(robot_cfg.sensors)
+    robot_cfg.bodies = _sorted_by_name(robot_cfg.bodies)
+    robot_cfg._normalized = _robot_fingerprint(robot_cfg)
 
 
 # --- Design helpers (robot/env/custom) ---------------------------------------
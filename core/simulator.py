@@ -1,20 +1,23 @@
 """High-level simulator with XPBD-style joints and impulse contacts."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-import copy
+from collections import deque
+from dataclasses import dataclass, field, replace
+from itertools import combinations
 import json
-import importlib
 import math
 import sys
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from types import CodeType, ModuleType
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
 import random
 import traceback
 
 from low_level_mechanics.entities import DynamicState, SimObject
 from low_level_mechanics.geometry import (
+    BoundingBox,
     Circle,
+    CollisionManifold,
     Polygon,
     collision_manifold,
 )
@@ -44,32 +47,162 @@ from .config import (
 from .controller_store import ensure_compiled_controller
 
 
+_sqrt = math.sqrt
+_INF = math.inf
+_SPAWN_OVERLAP_DIST = 0.05
+
+
+def _clamp_linear(vx: float, vy: float, speed_sq: float, max_linear: float) -> Optional[Tuple[float, float]]:
+    """Scale (vx, vy) down to ``max_linear``; ``None`` when the speed is already within the limit."""
+    # Plain sqrt unless the squares overflowed; hypot stays exact for huge components.
+    speed = _sqrt(speed_sq) if speed_sq < _INF else math.hypot(vx, vy)
+    if speed <= max_linear:
+        return None
+    scale = max_linear / max(speed, 1e-9)
+    return (vx * scale, vy * scale)
+
+
+def _clamp_angular(omega: float, max_angular: float) -> float:
+    """Clamp a finite angular speed whose magnitude exceeds ``max_angular``."""
+    # omega is finite and non-zero here, so a sign test matches copysign.
+    return max_angular if omega > 0.0 else -max_angular
+
+
+_MOTOR_REPORT_FIELDS = (
+    "slip_ratio",
+    "lateral_slip",
+    "wheel_speed",
+    "preferred_speed",
+    "contact_speed",
+    "contact_speed_after",
+    "applied_longitudinal_impulse",
+    "applied_lateral_impulse",
+)
+
+
+def _motor_trace_entry(motor: object, dt: float) -> Dict[str, object]:
+    """Per-step trace row for one motor; the report is probed once instead of once per field."""
+    entry: Dict[str, object] = {"command": getattr(motor, "last_command", 0.0)}
+    report = getattr(motor, "last_report", None)
+    if not report:
+        for key in _MOTOR_REPORT_FIELDS:
+            entry[key] = None
+        entry["applied_longitudinal_force"] = None
+        entry["applied_lateral_force"] = None
+        entry["normal_load"] = None
+        entry["step"] = None
+        return entry
+    for key in _MOTOR_REPORT_FIELDS:
+        entry[key] = getattr(report, key, None)
+    if dt > 0:
+        entry["applied_longitudinal_force"] = getattr(report, "applied_longitudinal_impulse", 0.0) / dt
+        entry["applied_lateral_force"] = getattr(report, "applied_lateral_impulse", 0.0) / dt
+    else:
+        entry["applied_longitudinal_force"] = None
+        entry["applied_lateral_force"] = None
+    entry["normal_load"] = getattr(report, "normal_load", None)
+    entry["step"] = getattr(report, "step", None)
+    return entry
+
+
 def _pose_from_tuple(p: PoseTuple) -> Pose2D:
     return Pose2D(p[0], p[1], p[2])
 
 
 def _material_from_config(cfg) -> MaterialProperties:
-    field_signals: Dict[str, float] = {}
+    line_intensity = None
     if getattr(cfg, "custom", None) and "line_intensity" in cfg.custom:
-        field_signals["line_intensity"] = float(cfg.custom["line_intensity"])
+        line_intensity = float(cfg.custom["line_intensity"])
     traction_value = getattr(cfg, "traction", None)
     if traction_value is None:
         traction_value = cfg.friction
-    return MaterialProperties(
-        friction=cfg.friction,
-        restitution=cfg.restitution,
-        reflectivity=cfg.reflect_line,
-        traction=traction_value,
+    return _cached_material(
+        cfg.friction,
+        cfg.restitution,
+        cfg.reflect_line,
+        traction_value,
+        line_intensity,
+        cfg.reflect_distance,
+        cfg.roughness,
+        cfg.thickness,
+        tuple(cfg.color),
+    )
+
+
+# Bodies with identical material settings (wall strokes, bounds, copies of a part) share one interned,
+# immutable instance.
+def _cached_material(
+    friction: float,
+    restitution: float,
+    reflectivity: float,
+    traction: float,
+    line_intensity: Optional[float],
+    reflect_distance: float,
+    roughness: float,
+    thickness: float,
+    color: Tuple[int, ...],
+) -> MaterialProperties:
+    field_signals: Dict[str, float] = {}
+    if line_intensity is not None:
+        field_signals["line_intensity"] = line_intensity
+    return MaterialProperties.intern(
+        friction=friction,
+        restitution=restitution,
+        reflectivity=reflectivity,
+        traction=traction,
         field_signals=field_signals,
         custom={
-            "reflect_distance": cfg.reflect_distance,
-            "roughness": cfg.roughness,
-            "thickness": cfg.thickness,
-            "color": tuple(cfg.color),
+            "reflect_distance": reflect_distance,
+            "roughness": roughness,
+            "thickness": thickness,
+            "color": color,
         },
     )
 
 
+# Compiled controller code keyed by (path, mtime_ns, size); robots sharing a controller file parse it once.
+_controller_code_cache: Dict[Tuple[str, int, int], CodeType] = {}
+
+
+def _exec_controller_module(module_name: str, path: Path) -> ModuleType:
+    """Create a fresh controller module, reusing compiled code while the file is unchanged on disk.
+
+    Each call still gets its own module namespace, so robots never share module-level state.
+    """
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    code = _controller_code_cache.get(key)
+    if code is None:
+        code = compile(path.read_bytes(), str(path), "exec")
+        for stale in [k for k in _controller_code_cache if k[0] == key[0]]:
+            del _controller_code_cache[stale]
+        _controller_code_cache[key] = code
+    module = ModuleType(module_name)
+    module.__file__ = str(path)
+    sys.modules[module_name] = module
+    try:
+        exec(code, module.__dict__)
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        raise
+    return module
+
+
+def _clone_robot_config(cfg: RobotConfig) -> RobotConfig:
+    """Copy the parts of a robot config that loading rewrites (names, body refs, params).
+
+    Geometry tuples and materials are immutable in practice and shared with the source config.
+    """
+    return replace(
+        cfg,
+        bodies=[replace(b) for b in cfg.bodies],
+        joints=[replace(j) for j in cfg.joints],
+        actuators=[replace(a, params=dict(a.params or {})) for a in cfg.actuators],
+        sensors=[replace(sn, params=dict(sn.params or {})) for sn in cfg.sensors],
+        measurements=[replace(m) for m in cfg.measurements],
+    )
+
+
 @dataclass
 class JointRuntime:
     cfg: JointConfig
@@ -77,6 +210,105 @@ class JointRuntime:
     compliance: float = 0.0
     damping: float = 0.01
     lambda_accum: float = 0.0
+    # Positional correction applied during the last step; replayed (scaled) when warm starting is enabled.
+    warm_lambda: float = 0.0
+    # Resolved endpoint bodies (bound by Simulator._index_bodies) so the solve skips name lookups.
+    parent: Optional[SimObject] = field(default=None, repr=False, compare=False)
+    child: Optional[SimObject] = field(default=None, repr=False, compare=False)
+
+
+class _BodyTable(Dict[str, SimObject]):
+    """``Simulator.bodies``: a plain name -> body dict whose every write bumps ``version``.
+
+    The simulator keeps index lists over the bodies; comparing versions tells it when they are stale, even
+    when a body is replaced under an existing name.
+    """
+
+    version = 0
+
+    def __setitem__(self, name: str, body: SimObject) -> None:
+        super().__setitem__(name, body)
+        self.version += 1
+
+    def __delitem__(self, name: str) -> None:
+        super().__delitem__(name)
+        self.version += 1
+
+    def pop(self, *args):  # type: ignore[override]
+        result = super().pop(*args)
+        self.version += 1
+        return result
+
+    def popitem(self) -> Tuple[str, SimObject]:
+        result = super().popitem()
+        self.version += 1
+        return result
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+    def update(self, *args, **kwargs) -> None:  # type: ignore[override]
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def setdefault(self, name: str, default: SimObject) -> SimObject:  # type: ignore[override]
+        result = super().setdefault(name, default)
+        self.version += 1
+        return result
+
+    def __ior__(self, other):  # type: ignore[override]
+        result = super().__ior__(other)
+        self.version += 1
+        return result
+
+
+class _StaticGrid:
+    """Uniform spatial hash over static body AABBs; static bodies never move, so it is built once per load."""
+
+    def __init__(self, cell_size: float) -> None:
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        self.boxes: Dict[int, Tuple[float, float, float, float]] = {}
+
+    def _span(self, min_x: float, min_y: float, max_x: float, max_y: float) -> Tuple[int, int, int, int]:
+        size = self.cell_size
+        return (
+            math.floor(min_x / size),
+            math.floor(min_y / size),
+            math.floor(max_x / size),
+            math.floor(max_y / size),
+        )
+
+    def insert(self, index: int, box: BoundingBox) -> None:
+        self.boxes[index] = (box.min_x, box.min_y, box.max_x, box.max_y)
+        x0, y0, x1, y1 = self._span(box.min_x, box.min_y, box.max_x, box.max_y)
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cells.setdefault((cx, cy), []).append(index)
+
+    def query(self, box: BoundingBox, margin: float) -> set:
+        """Indices whose AABB overlaps ``box`` grown by ``margin`` (bucket hits are checked exactly)."""
+        min_x = box.min_x - margin
+        min_y = box.min_y - margin
+        max_x = box.max_x + margin
+        max_y = box.max_y + margin
+        x0, y0, x1, y1 = self._span(min_x, min_y, max_x, max_y)
+        cells = self.cells
+        candidates: set = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    candidates.update(bucket)
+        boxes = self.boxes
+        found: set = set()
+        for idx in candidates:
+            b_min_x, b_min_y, b_max_x, b_max_y = boxes[idx]
+            if b_max_x >= min_x and b_min_x <= max_x and b_max_y >= min_y and b_min_y <= max_y:
+                found.add(idx)
+        return found
 
 
 class Simulator:
@@ -89,7 +321,34 @@ class Simulator:
         self.gravity: Tuple[float, float] = (0.0, -9.81)
         self.time: float = 0.0
         self.step_index: int = 0
-        self.bodies: Dict[str, SimObject] = {}
+        self._bodies = _BodyTable()
+        # Movable/static partitions of ``bodies`` (insertion order kept); rebuilt by _index_bodies().
+        self._dynamic_bodies: List[Tuple[str, SimObject]] = []
+        # Consecutive near-still steps per movable body (aligned with _dynamic_bodies), used by sleeping.
+        self._quiet_steps: List[int] = []
+        # _body_list indices of movable bodies pushed by a queued force/torque or a contact this step; they stay awake.
+        self._woken_bodies: Set[int] = set()
+        self._static_bodies: List[SimObject] = []
+        # bodies.version at the last _index_bodies(); -1 forces a rebuild (see invalidate_bodies()).
+        self._indexed_body_version: int = -1
+        # Contact broad phase: body list/indices matching dict order plus a hash of static AABBs.
+        self._body_list: List[SimObject] = []
+        self._body_entries: List[Tuple[str, SimObject]] = []
+        # Contact material coefficients aligned with _body_list (materials are fixed after load).
+        self._body_restitution: List[float] = []
+        self._body_friction: List[float] = []
+        self._dynamic_indices: List[int] = []
+        self._static_grid: Optional[_StaticGrid] = None
+        # (i, j) -> (pose_a, pose_b, manifold) from the last narrow-phase call; Pose2D is frozen and bodies get a
+        # new pose object whenever they move, so identical pose objects mean an identical manifold.
+        self._manifold_cache: Dict[Tuple[int, int], Tuple[Pose2D, Pose2D, Optional[CollisionManifold]]] = {}
+        # (i, j) -> (restitution, friction) combined for the pair on first contact; materials never change.
+        self._pair_coefficients: Dict[Tuple[int, int], Tuple[float, float]] = {}
+        # (name, motor, owner robot id) rows; rebuilt by _index_devices().
+        self._motor_entries: List[Tuple[str, WheelMotor, Optional[str]]] = []
+        self._sensor_entries: List[Tuple[str, Sensor, Optional[str]]] = []
+        # Per-robot (controller instance, bound tick function); re-resolved only when the instance changes.
+        self._tick_fns: Dict[str, Tuple[object, Optional[Callable[..., object]]]] = {}
         self.joints: List[JointRuntime] = []
         self.sensors: Dict[str, Sensor] = {}
         self.motors: Dict[str, WheelMotor] = {}
@@ -121,13 +380,37 @@ class Simulator:
         self.contact_correction_percent: float = 0.25
         self.contact_slop: float = 0.002
         self.max_penetration_correction: float = 0.05
+        # Fraction of each joint's previous-step correction re-applied before solving (0 disables warm starting).
+        self.joint_warm_start: float = 0.0
+        # Sleeping: a movable body whose speed stays below sleep_velocity for sleep_steps steps has its residual
+        # drift zeroed, after which integration skips it until a force or contact wakes it (0 disables).
+        self.sleep_velocity: float = 0.0
+        self.sleep_steps: int = 30
+        # Jacobi-style contact position correction: sum each body's pushes over the pass and move it once at
+        # the end (one Pose2D per body instead of one per contact). Off keeps the sequential Gauss-Seidel update.
+        self.contact_jacobi_positions: bool = False
         self.max_step_translation: float = 0.5
         self.debug_checks: bool = False
         # Optional per-step trace logging
         self.trace_enabled: bool = False
-        self.trace_log: List[Dict[str, object]] = []
+        # Unbounded unless enable_trace_logging(max_entries=...) caps it; then the oldest steps are dropped.
+        self.trace_log: Deque[Dict[str, object]] = deque()
         self.trace_callback: Optional[Callable[[Dict[str, object]], None]] = None
 
+    @property
+    def bodies(self) -> Dict[str, SimObject]:
+        """Name -> body table; writes through it (including replacing a body) re-index on the next use."""
+        return self._bodies
+
+    @bodies.setter
+    def bodies(self, value: Dict[str, SimObject]) -> None:
+        self._bodies = value if isinstance(value, _BodyTable) else _BodyTable(value)
+        self._indexed_body_version = -1
+
+    def invalidate_bodies(self) -> None:
+        """Rebuild the body index lists on next use; call after changing a body's ``can_move`` in place."""
+        self._indexed_body_version = -1
+
     # --- Loading ---------------------------------------------------------
     def load(
         self,
@@ -157,6 +440,7 @@ class Simulator:
         self.motors.clear()
         self.controller_instances.clear()
         self.controller_modules.clear()
+        self._tick_fns.clear()
         self.robot_ids = []
         self.robot_roles = {}
         self.robot_spawn = {}
@@ -195,7 +479,7 @@ class Simulator:
         if multi and self.max_step_translation > 0.25:
             self.max_step_translation = 0.25
         for idx, robot in enumerate(robot_list):
-            robot_id = robot.id or f"robot_{idx+1}"
+            robot_id = sys.intern(robot.id or f"robot_{idx+1}")
             spawn_pose = spawn_overrides.get(robot_id) if spawn_overrides else robot.spawn_pose
             prepared_cfg = self._prepare_robot_config(
                 robot_id, robot.config, spawn_pose or robot.spawn_pose, prefix_names=multi
@@ -221,18 +505,88 @@ class Simulator:
             for sensor_cfg in prepared_cfg.sensors:
                 self._attach_sensor(sensor_cfg, robot_id)
             self._load_controller_for_robot(robot_id, prepared_cfg.controller_module, scenario_path)
+        self._index_bodies()
+        self._index_devices()
         if len(self.robot_spawn) > 1:
-            ids = list(self.robot_spawn.items())
-            for i in range(len(ids)):
-                for j in range(i + 1, len(ids)):
-                    (id_a, pose_a) = ids[i]
-                    (id_b, pose_b) = ids[j]
-                    dist = math.hypot(pose_a[0] - pose_b[0], pose_a[1] - pose_b[1])
-                    if dist < 0.05:
-                        warning = f"spawn overlap between {id_a} and {id_b} (d={dist:.3f} m)"
-                        self.last_physics_warning = warning
-                        if self.debug_checks:
-                            print(f"[sim][warn] {warning}")
+            # Squared distances gate the pairs; only an actual overlap pays for hypot and the warning text.
+            limit_sq = _SPAWN_OVERLAP_DIST * _SPAWN_OVERLAP_DIST
+            for (id_a, pose_a), (id_b, pose_b) in combinations(self.robot_spawn.items(), 2):
+                dx = pose_a[0] - pose_b[0]
+                dy = pose_a[1] - pose_b[1]
+                if dx * dx + dy * dy < limit_sq:
+                    dist = math.hypot(dx, dy)
+                    warning = f"spawn overlap between {id_a} and {id_b} (d={dist:.3f} m)"
+                    self.last_physics_warning = warning
+                    if self.debug_checks:
+                        print(f"[sim][warn] {warning}")
+
+    def _index_bodies(self) -> None:
+        """Split bodies into movable and static lists so per-step loops skip terrain and walls."""
+        self._dynamic_bodies = [(name, body) for name, body in self.bodies.items() if body.can_move]
+        self._static_bodies = [body for body in self.bodies.values() if not body.can_move]
+        self._indexed_body_version = self._bodies.version
+        self._body_entries = list(self.bodies.items())
+        self._body_list = [body for _, body in self._body_entries]
+        self._body_restitution = [
+            max(0.0, min(1.0, getattr(body.material, "restitution", 0.1))) for body in self._body_list
+        ]
+        self._body_friction = [getattr(body.material, "friction", 0.6) for body in self._body_list]
+        self._dynamic_indices = [idx for idx, body in enumerate(self._body_list) if body.can_move]
+        self._static_grid = self._build_static_grid()
+        self._manifold_cache = {}
+        self._pair_coefficients = {}
+        self._quiet_steps = [0] * len(self._dynamic_bodies)
+        for jr in self.joints:
+            jr.parent = self.bodies.get(jr.cfg.parent)
+            jr.child = self.bodies.get(jr.cfg.child)
+
+    def _index_devices(self) -> None:
+        self._motor_entries = [(name, motor, self.motor_owners.get(name)) for name, motor in self.motors.items()]
+        self._sensor_entries = [(name, sensor, self.sensor_owners.get(name)) for name, sensor in self.sensors.items()]
+
+    def _build_static_grid(self) -> Optional[_StaticGrid]:
+        if not self._dynamic_indices or not self._static_bodies:
+            return None
+        # Cells about twice the largest movable body keep each query to a handful of buckets.
+        extent = 0.0
+        for idx in self._dynamic_indices:
+            box = self._body_list[idx].bounding_box()
+            extent = max(extent, box.max_x - box.min_x, box.max_y - box.min_y)
+        grid = _StaticGrid(max(2.0 * extent, 0.05))
+        for idx, body in enumerate(self._body_list):
+            if not body.can_move:
+                grid.insert(idx, body.bounding_box())
+        return grid
+
+    def _contact_pairs(self) -> List[Tuple[int, int]]:
+        """Broad phase: (i, j) index pairs, i < j, whose AABBs may touch, in full pairwise-scan order."""
+        dynamic = self._dynamic_indices
+        body_list = self._body_list
+        # Margin covers the positional corrections a body can pick up earlier in the same pass.
+        margin = 2.0 * self.max_penetration_correction
+        boxes = [(i, body_list[i].bounding_box()) for i in dynamic]
+        pairs: List[Tuple[int, int]] = []
+        if len(boxes) > 1:
+            # Sweep and prune over the margin-grown movable boxes, sorted by min x.
+            fat = sorted(
+                (box.min_x - margin, box.min_y - margin, box.max_x + margin, box.max_y + margin, i)
+                for i, box in boxes
+            )
+            active: List[Tuple[float, float, float, float, int]] = []
+            for entry in fat:
+                min_x, min_y, _, max_y, i = entry
+                active = [other for other in active if other[2] >= min_x]
+                for _, o_min_y, _, o_max_y, j in active:
+                    if o_max_y >= min_y and o_min_y <= max_y:
+                        pairs.append((j, i) if j < i else (i, j))
+                active.append(entry)
+        grid = self._static_grid
+        if grid is not None:
+            for i, box in boxes:
+                for j in grid.query(box, margin):
+                    pairs.append((j, i) if j < i else (i, j))
+        pairs.sort()
+        return pairs
 
     def _make_body(self, body_cfg: BodyConfig, spawn_pose: Optional[PoseTuple] = None) -> SimObject:
         points = body_cfg.points
@@ -336,11 +690,14 @@ class Simulator:
             return
         prev_module = self.controller_modules.get(robot_id) if keep_previous else None
         prev_instance = self.controller_instances.get(robot_id) if keep_previous else None
-        sys.path.insert(0, str(module_dir))
+        # The module directory only needs to be importable while the controller executes (sibling helper
+        # imports); skip the insert/pop when a caller already put it at the front of sys.path.
+        path_entry = str(module_dir)
+        pushed_path = not sys.path or sys.path[0] != path_entry
+        if pushed_path:
+            sys.path.insert(0, path_entry)
         try:
-            if module_name in sys.modules:
-                del sys.modules[module_name]
-            module_obj = importlib.import_module(module_name)
+            module_obj = _exec_controller_module(module_name, controller_path)
             self.controller_modules[robot_id] = module_obj
             RobotController = getattr(module_obj, "Controller", None)
             instance = RobotController(self) if RobotController else None
@@ -371,7 +728,7 @@ class Simulator:
                     self.controller_module = None
                     self.controller_instance = None
         finally:
-            if sys.path and sys.path[0] == str(module_dir):
+            if pushed_path and sys.path and sys.path[0] == path_entry:
                 sys.path.pop(0)
 
     def _load_controller(self, module_name: str, scenario_path: Path, keep_previous: bool = False) -> None:
@@ -416,17 +773,18 @@ class Simulator:
     def _prepare_robot_config(
         self, robot_id: str, robot_cfg: RobotConfig, spawn_pose: PoseTuple, *, prefix_names: bool
     ) -> RobotConfig:
-        cfg = copy.deepcopy(robot_cfg)
+        cfg = _clone_robot_config(robot_cfg)
         cfg.spawn_pose = spawn_pose
         if not getattr(cfg, "controller_module", None):
             cfg.controller_module = "controller"
         if not prefix_names:
             return cfg
+        # Interned so the per-step dict lookups keyed by these names hit the identity shortcut.
         prefix = f"{robot_id}/"
         body_map = {}
         for body in cfg.bodies:
             old_name = body.name
-            new_name = prefix + old_name
+            new_name = sys.intern(prefix + old_name)
             body_map[old_name] = new_name
             body.name = new_name
         for joint in cfg.joints:
@@ -434,14 +792,14 @@ class Simulator:
             joint.child = body_map.get(joint.child, joint.child)
         for act in cfg.actuators:
             act.body = body_map.get(act.body, act.body)
-            act.name = prefix + act.name
+            act.name = sys.intern(prefix + act.name)
         for sensor in cfg.sensors:
             sensor.body = body_map.get(sensor.body, sensor.body)
-            sensor.name = prefix + sensor.name
+            sensor.name = sys.intern(prefix + sensor.name)
         for meas in cfg.measurements:
             if meas.body:
                 meas.body = body_map.get(meas.body, meas.body)
-            meas.name = prefix + meas.name
+            meas.name = sys.intern(prefix + meas.name)
             # signal may reference sensor; leave unchanged unless clearly namespaced
         return cfg
 
@@ -527,22 +885,22 @@ class Simulator:
             if len(pts) < 2:
                 continue
             thickness = max(1e-4, float(getattr(stroke, "thickness", 0.05)))
+            half = thickness / 2.0
             color = tuple(getattr(stroke, "color", (160, 160, 180)))
-            for i in range(len(pts) - 1):
-                p0 = pts[i]
-                p1 = pts[i + 1]
-                dx = p1[0] - p0[0]
-                dy = p1[1] - p0[1]
+            # Walk consecutive point pairs with unpacked coordinates (no per-segment indexing).
+            for (x0, y0), (x1, y1) in zip(pts, pts[1:]):
+                dx = x1 - x0
+                dy = y1 - y0
                 seg_len = math.hypot(dx, dy)
                 if seg_len < 1e-6:
                     continue
-                nx = -dy / seg_len * (thickness / 2.0)
-                ny = dx / seg_len * (thickness / 2.0)
+                nx = -dy / seg_len * half
+                ny = dx / seg_len * half
                 rect = [
-                    (p0[0] + nx, p0[1] + ny),
-                    (p1[0] + nx, p1[1] + ny),
-                    (p1[0] - nx, p1[1] - ny),
-                    (p0[0] - nx, p0[1] - ny),
+                    (x0 + nx, y0 + ny),
+                    (x1 + nx, y1 + ny),
+                    (x1 - nx, y1 - ny),
+                    (x0 - nx, y0 - ny),
                 ]
                 configs.append(self._make_static_body_cfg(f"env_wall_{seg_idx}", rect, color=color))
                 seg_idx += 1
@@ -553,7 +911,11 @@ class Simulator:
         if dt is None:
             dt = self.dt
         self.last_physics_warning = None
-        prev_poses = {name: body.pose for name, body in self.bodies.items()}
+        if self._indexed_body_version != self._bodies.version:
+            self._index_bodies()
+        # Pose2D is frozen, so holding the references is a safe snapshot; the list lines up with _dynamic_bodies.
+        prev_poses = [body.pose for _, body in self._dynamic_bodies]
+        self._woken_bodies.clear()
         # Sensors read before controller
         sensor_readings = self._update_sensors(dt)
         self.last_sensor_readings = sensor_readings
@@ -566,12 +928,22 @@ class Simulator:
         # Contacts
         self._solve_contacts(dt)
         self._check_step_sanity(prev_poses, dt)
-        self.last_motor_commands = {name: getattr(motor, "last_command", 0.0) for name, motor in self.motors.items()}
+        if self.sleep_velocity > 0.0:
+            self._settle_bodies()
+        if len(self._motor_entries) != len(self.motors):
+            self._index_devices()
+        # One pass fills both the flat and per-robot command maps (fresh dicts, callers may keep old ones).
+        commands: Dict[str, float] = {}
         motor_map: Dict[str, Dict[str, float]] = {}
-        for name, cmd in self.last_motor_commands.items():
-            owner = self.motor_owners.get(name)
+        for name, motor, owner in self._motor_entries:
+            cmd = getattr(motor, "last_command", 0.0)
+            commands[name] = cmd
             if owner:
-                motor_map.setdefault(owner, {})[name] = cmd
+                per_robot = motor_map.get(owner)
+                if per_robot is None:
+                    per_robot = motor_map[owner] = {}
+                per_robot[name] = cmd
+        self.last_motor_commands = commands
         self.last_motor_commands_by_robot = motor_map
         if self.trace_enabled:
             self._record_trace(dt)
@@ -584,12 +956,18 @@ class Simulator:
         callback: Optional[Callable[[Dict[str, object]], None]] = None,
         *,
         clear_existing: bool = True,
+        max_entries: Optional[int] = None,
     ) -> None:
-        """Toggle per-step trace capture; optional callback for streaming."""
+        """Toggle per-step trace capture; optional callback for streaming.
+
+        ``max_entries`` keeps only the most recent steps in memory (the callback still sees every entry).
+        """
         self.trace_enabled = enabled
         self.trace_callback = callback
         if clear_existing:
-            self.trace_log.clear()
+            self.trace_log = deque(maxlen=max_entries)
+        elif max_entries != self.trace_log.maxlen:
+            self.trace_log = deque(self.trace_log, maxlen=max_entries)
 
     def export_trace_log(self) -> List[Dict[str, object]]:
         return list(self.trace_log)
@@ -597,38 +975,55 @@ class Simulator:
     def clear_trace_log(self) -> None:
         self.trace_log.clear()
 
-    def save_trace_log(self, path: Path) -> None:
-        """Persist the current trace log to disk as JSON."""
+    def save_trace_log(self, path: Path, *, indent: bool = False) -> None:
+        """Persist the current trace log to disk as JSON (compact unless ``indent`` is set).
+
+        Compact output is streamed chunk by chunk so long runs never build the whole document in memory.
+        """
         path.parent.mkdir(parents=True, exist_ok=True)
         with path.open("w", encoding="utf-8") as f:
-            json.dump(self.trace_log, f, indent=2)
+            entries = list(self.trace_log)
+            if indent:
+                json.dump(entries, f, indent=2)
+            else:
+                f.writelines(json.JSONEncoder(separators=(",", ":")).iterencode(entries))
 
     def _update_sensors(self, dt: float) -> Dict[str, object]:
         readings: Dict[str, object] = {}
         per_robot: Dict[str, Dict[str, object]] = {rid: {} for rid in self.robot_ids}
-        for name, sensor in self.sensors.items():
+        if len(self._sensor_entries) != len(self.sensors):
+            self._index_devices()
+        for name, sensor, owner in self._sensor_entries:
             reading = sensor.read(self, dt)  # type: ignore[arg-type]
             if reading:
-                readings[name] = reading.value
-                owner = self.sensor_owners.get(name)
+                value = reading.value
+                readings[name] = value
                 if owner:
-                    per_robot.setdefault(owner, {})[name] = reading.value
+                    per_robot.setdefault(owner, {})[name] = value
         self.last_sensor_readings_by_robot = per_robot
         return readings
 
     def _tick_controller(self, sensor_readings: Dict[str, object], dt: float) -> None:
         if not self.robot_ids:
             return
+        tick_fns = self._tick_fns
+        errors = self.last_controller_errors
+        readings_by_robot = self.last_sensor_readings_by_robot
         for rid in self.robot_ids:
             ctrl = self.controller_instances.get(rid) if self.controller_instances else self.controller_instance
             if not ctrl:
                 continue
-            tick_fn = getattr(ctrl, "step", None) or getattr(ctrl, "update", None)
+            cached = tick_fns.get(rid)
+            if cached is not None and cached[0] is ctrl:
+                tick_fn = cached[1]
+            else:
+                tick_fn = getattr(ctrl, "step", None) or getattr(ctrl, "update", None)
+                tick_fns[rid] = (ctrl, tick_fn)
             if not tick_fn:
                 continue
-            if self.last_controller_errors.get(rid):
+            if errors.get(rid):
                 continue
-            per_robot_readings = self.last_sensor_readings_by_robot.get(rid, sensor_readings)
+            per_robot_readings = readings_by_robot.get(rid, sensor_readings)
             try:
                 tick_fn(per_robot_readings, dt)
             except Exception:
@@ -643,22 +1038,54 @@ class Simulator:
     def _sanitize_velocity(self, body: SimObject) -> None:
         vx, vy = body.state.linear_velocity
         omega = body.state.angular_velocity
-        if not all(math.isfinite(v) for v in (vx, vy)):
-            body.state.linear_velocity = (0.0, 0.0)
-            self._flag_warning(f"{body.name}: reset invalid linear velocity")
-            vx, vy = body.state.linear_velocity
-        if not math.isfinite(omega):
-            body.state.angular_velocity = 0.0
-            self._flag_warning(f"{body.name}: reset invalid angular velocity")
-            omega = 0.0
-        speed = math.hypot(vx, vy)
-        if self.max_linear_speed > 0.0 and speed > self.max_linear_speed:
-            scale = self.max_linear_speed / max(speed, 1e-9)
-            body.state.linear_velocity = (vx * scale, vy * scale)
-            self._flag_warning(f"{body.name}: clamped linear speed to {self.max_linear_speed:.2f} m/s")
-        if self.max_angular_speed > 0.0 and abs(omega) > self.max_angular_speed:
-            body.state.angular_velocity = math.copysign(self.max_angular_speed, omega)
-            self._flag_warning(f"{body.name}: clamped angular speed to {self.max_angular_speed:.2f} rad/s")
+        # x - x is 0.0 for finite x and NaN for inf/NaN, so one comparison vets all three components.
+        if (vx - vx) + (vy - vy) + (omega - omega) != 0.0:
+            if not all(math.isfinite(v) for v in (vx, vy)):
+                body.state.linear_velocity = (0.0, 0.0)
+                self._flag_warning(f"{body.name}: reset invalid linear velocity")
+                vx, vy = body.state.linear_velocity
+            if not math.isfinite(omega):
+                body.state.angular_velocity = 0.0
+                self._flag_warning(f"{body.name}: reset invalid angular velocity")
+                omega = 0.0
+        max_linear = self.max_linear_speed
+        # Squared gate first; the clamp helper (and its sqrt) only runs when a clamp is likely.
+        speed_sq = vx * vx + vy * vy
+        if max_linear > 0.0 and speed_sq > max_linear * max_linear:
+            clamped = _clamp_linear(vx, vy, speed_sq, max_linear)
+            if clamped is not None:
+                body.state.linear_velocity = clamped
+                self._flag_warning(f"{body.name}: clamped linear speed to {max_linear:.2f} m/s")
+        max_angular = self.max_angular_speed
+        if max_angular > 0.0 and abs(omega) > max_angular:
+            body.state.angular_velocity = _clamp_angular(omega, max_angular)
+            self._flag_warning(f"{body.name}: clamped angular speed to {max_angular:.2f} rad/s")
+
+    def _settle_bodies(self) -> None:
+        """Put bodies that have stayed nearly still for ``sleep_steps`` steps to sleep (exactly zero velocity).
+
+        A body that was pushed this step (queued force/torque or a contact) is awake: its quiet count restarts
+        and its velocity is left alone, so a small steady force still accelerates a sleeping body.
+        """
+        limit_sq = self.sleep_velocity * self.sleep_velocity
+        needed = self.sleep_steps
+        quiet = self._quiet_steps
+        woken = self._woken_bodies
+        for idx, (body_idx, (_, body)) in enumerate(zip(self._dynamic_indices, self._dynamic_bodies)):
+            if body_idx in woken:
+                quiet[idx] = 0
+                continue
+            state = body.state
+            vx, vy = state.linear_velocity
+            omega = state.angular_velocity
+            if vx * vx + vy * vy + omega * omega >= limit_sq:
+                quiet[idx] = 0
+                continue
+            if quiet[idx] < needed:
+                quiet[idx] += 1
+            elif vx or vy or omega:
+                state.linear_velocity = (0.0, 0.0)
+                state.angular_velocity = 0.0
 
     def _sanitize_pose(self, body: SimObject) -> None:
         pose = body.pose
@@ -666,19 +1093,19 @@ class Simulator:
             body.pose = Pose2D(0.0, 0.0, 0.0)
             self._flag_warning(f"{body.name}: reset pose due to invalid values")
 
-    def _check_step_sanity(self, prev_poses: Dict[str, Pose2D], dt: float) -> None:
+    def _check_step_sanity(self, prev_poses: List[Pose2D], dt: float) -> None:
         if self.max_step_translation <= 0.0:
             return
         limit = self.max_step_translation
-        for name, body in self.bodies.items():
-            if not body.can_move:
-                continue
-            prev = prev_poses.get(name)
-            if not prev:
-                continue
+        limit_sq = limit * limit
+        for (name, body), prev in zip(self._dynamic_bodies, prev_poses):
             dx = body.pose.x - prev.x
             dy = body.pose.y - prev.y
-            dist = math.hypot(dx, dy)
+            # Compare squared distances; the sqrt is only needed for bodies that actually need clamping.
+            dist_sq = dx * dx + dy * dy
+            if dist_sq <= limit_sq:
+                continue
+            dist = _sqrt(dist_sq) if dist_sq < _INF else math.hypot(dx, dy)
             if not math.isfinite(dist):
                 self._flag_warning(f"{name}: invalid step distance; resetting pose")
                 body.pose = prev
@@ -709,31 +1136,17 @@ class Simulator:
                 "sensors": self.last_sensor_readings_by_robot.get(rid, {}),
                 "pose": None,
             }
-        for name, motor in self.motors.items():
-            report = getattr(motor, "last_report", None)
-            entry["motors"][name] = {
-                "command": getattr(motor, "last_command", 0.0),
-                "slip_ratio": getattr(report, "slip_ratio", None) if report else None,
-                "lateral_slip": getattr(report, "lateral_slip", None) if report else None,
-                "wheel_speed": getattr(report, "wheel_speed", None) if report else None,
-                "preferred_speed": getattr(report, "preferred_speed", None) if report else None,
-                "contact_speed": getattr(report, "contact_speed", None) if report else None,
-                "contact_speed_after": getattr(report, "contact_speed_after", None) if report else None,
-                "applied_longitudinal_impulse": getattr(report, "applied_longitudinal_impulse", None) if report else None,
-                "applied_lateral_impulse": getattr(report, "applied_lateral_impulse", None) if report else None,
-                "applied_longitudinal_force": (
-                    getattr(report, "applied_longitudinal_impulse", 0.0) / dt if report and dt > 0 else None
-                ),
-                "applied_lateral_force": (
-                    getattr(report, "applied_lateral_impulse", 0.0) / dt if report and dt > 0 else None
-                ),
-                "normal_load": getattr(report, "normal_load", None) if report else None,
-                "step": getattr(report, "step", None) if report else None,
-            }
-            owner = self.motor_owners.get(name)
+        if len(self._motor_entries) != len(self.motors):
+            self._index_devices()
+        if self._indexed_body_version != self._bodies.version:
+            self._index_bodies()
+        motors_trace = entry["motors"]
+        for name, motor, owner in self._motor_entries:
+            motor_entry = _motor_trace_entry(motor, dt)
+            motors_trace[name] = motor_entry
             if owner and owner in robot_trace:
-                robot_trace[owner].setdefault("motors", {})[name] = entry["motors"][name]
-        for name, body in self.bodies.items():
+                robot_trace[owner].setdefault("motors", {})[name] = motor_entry
+        for name, body in self._body_entries:
             entry["bodies"][name] = {
                 "pose": body.pose.as_dict(),
                 "lin_vel": body.state.linear_velocity,
@@ -757,39 +1170,67 @@ class Simulator:
 
     def _integrate_bodies(self, dt: float) -> None:
         gx, gy = self.gravity
-        for body in self.bodies.values():
-            if not body.can_move or body.state.mass <= 0:
+        linear_damping = self.linear_damping
+        angular_damping = self.angular_damping
+        for body in self._static_bodies:
+            body.clear_impulses()
+        # Without gravity a body at rest stays exactly put; skipping it also keeps its pose object (and the
+        # geometry caches keyed on it) alive.
+        skip_resting = gx == 0.0 and gy == 0.0
+        woken = self._woken_bodies if self.sleep_velocity > 0.0 else None
+        # Single pass per movable body: damping, velocity vetting, integration (gravity folded in), pose vetting.
+        for idx, (_, body) in zip(self._dynamic_indices, self._dynamic_bodies):
+            if skip_resting and body.is_resting():
+                continue
+            if woken is not None and body.has_pending_forces():
+                woken.add(idx)
+            state = body.state
+            mass = state.mass
+            if mass <= 0:
                 body.clear_impulses()
                 continue
-            # gravity
-            body.apply_force((gx * body.state.mass, gy * body.state.mass))
-            # simple damping
-            vx, vy = body.state.linear_velocity
-            body.state.linear_velocity = (vx * self.linear_damping, vy * self.linear_damping)
-            body.state.angular_velocity *= self.angular_damping
+            vx, vy = state.linear_velocity
+            state.linear_velocity = (vx * linear_damping, vy * linear_damping)
+            state.angular_velocity *= angular_damping
             self._sanitize_velocity(body)
-            body.integrate(dt)
-            self._sanitize_pose(body)
+            body.integrate(dt, (gx * mass, gy * mass))
+            pose = body.pose
+            if (pose.x - pose.x) + (pose.y - pose.y) + (pose.theta - pose.theta) != 0.0:
+                self._sanitize_pose(body)
 
     def _solve_joints(self, dt: float) -> None:
         # Minimal XPBD distance constraint for hinge anchors (if any)
+        warm = self.joint_warm_start
+        max_correction = self.max_penetration_correction
         for jr in self.joints:
-            parent = self.bodies.get(jr.cfg.parent)
-            child = self.bodies.get(jr.cfg.child)
+            parent = jr.parent or self.bodies.get(jr.cfg.parent)
+            child = jr.child or self.bodies.get(jr.cfg.child)
             if not parent or not child or not parent.can_move and not child.can_move:
                 continue
+            inv_mass_a = 0.0 if not parent.can_move else 1.0 / max(parent.state.mass, 1e-6)
+            inv_mass_b = 0.0 if not child.can_move else 1.0 / max(child.state.mass, 1e-6)
+            applied = 0.0
+            if warm > 0.0 and jr.warm_lambda:
+                # Temporal coherence: a steady load needs about the same correction as last step.
+                applied = max(-max_correction, min(max_correction, warm * jr.warm_lambda))
+                self._apply_joint_correction(jr, parent, child, applied, inv_mass_a, inv_mass_b)
+            jr.warm_lambda = applied
             pa = parent.pose.transform_point(jr.cfg.anchor_parent)
             pb = child.pose.transform_point(jr.cfg.anchor_child)
             dx = pb[0] - pa[0]
             dy = pb[1] - pa[1]
-            dist = math.hypot(dx, dy)
+            dist_sq = dx * dx + dy * dy
             target = jr.cfg.upper_limit if jr.cfg.lower_limit == jr.cfg.upper_limit else 0.0
-            error = dist - target
-            if abs(error) < 1e-5:
+            # Satisfied constraints (|dist - target| < 1e-5) are rejected on squared distances, without a sqrt.
+            upper = target + 1e-5
+            lower = target - 1e-5
+            if dist_sq < upper * upper and (lower <= 0.0 or dist_sq > lower * lower):
                 continue
-            n = (dx / (dist + 1e-6), dy / (dist + 1e-6))
-            inv_mass_a = 0.0 if not parent.can_move else 1.0 / max(parent.state.mass, 1e-6)
-            inv_mass_b = 0.0 if not child.can_move else 1.0 / max(child.state.mass, 1e-6)
+            dist = _sqrt(dist_sq)
+            error = dist - target
+            inv_dist = 1.0 / (dist + 1e-6)
+            nx = dx * inv_dist
+            ny = dy * inv_dist
             w = inv_mass_a + inv_mass_b
             if w == 0:
                 continue
@@ -798,96 +1239,161 @@ class Simulator:
             if not math.isfinite(dlambda):
                 continue
             jr.lambda_accum += dlambda
-            correction = max(-self.max_penetration_correction, min(self.max_penetration_correction, dlambda))
+            limit = max_correction
+            if applied:
+                # A replayed lambda leaves a remainder that is no longer a whole max_correction step; with zero
+                # compliance the bare clamp would then flip the error's sign every step, so stop at the target.
+                limit = min(limit, abs(error) / w)
+            correction = max(-limit, min(limit, dlambda))
+            jr.warm_lambda = applied + correction
             if parent.can_move:
-                parent.pose = parent.pose.translated(-n[0] * correction * inv_mass_a, -n[1] * correction * inv_mass_a)
+                parent.pose = parent.pose.translated(-nx * correction * inv_mass_a, -ny * correction * inv_mass_a)
             if child.can_move:
-                child.pose = child.pose.translated(n[0] * correction * inv_mass_b, n[1] * correction * inv_mass_b)
+                child.pose = child.pose.translated(nx * correction * inv_mass_b, ny * correction * inv_mass_b)
+
+    @staticmethod
+    def _apply_joint_correction(
+        jr: JointRuntime, parent: SimObject, child: SimObject, correction: float, inv_mass_a: float, inv_mass_b: float
+    ) -> None:
+        """Push the joint anchors apart/together by ``correction`` along their current axis."""
+        pa = parent.pose.transform_point(jr.cfg.anchor_parent)
+        pb = child.pose.transform_point(jr.cfg.anchor_child)
+        dx = pb[0] - pa[0]
+        dy = pb[1] - pa[1]
+        dist = _sqrt(dx * dx + dy * dy)
+        if dist < 1e-9:
+            return
+        nx = dx / dist
+        ny = dy / dist
+        if parent.can_move:
+            parent.pose = parent.pose.translated(-nx * correction * inv_mass_a, -ny * correction * inv_mass_a)
+        if child.can_move:
+            child.pose = child.pose.translated(nx * correction * inv_mass_b, ny * correction * inv_mass_b)
 
     def _solve_contacts(self, dt: float) -> None:
-        names = list(self.bodies.keys())
-        for i in range(len(names)):
-            for j in range(i + 1, len(names)):
-                a = self.bodies[names[i]]
-                b = self.bodies[names[j]]
-                if not (a.can_move or b.can_move):
-                    continue
-                manifold = collision_manifold(a.shape, a.pose, b.shape, b.pose)
-                if not manifold:
-                    continue
-                normal = manifold.normal
-                penetration = manifold.penetration
-                inv_mass_a = 0.0 if not a.can_move else 1.0 / max(a.state.mass, 1e-6)
-                inv_mass_b = 0.0 if not b.can_move else 1.0 / max(b.state.mass, 1e-6)
-                inv_mass_sum = inv_mass_a + inv_mass_b
-                if inv_mass_sum == 0:
-                    continue
-                # positional correction (baumgarte-ish)
-                percent = self.contact_correction_percent
-                slop = self.contact_slop
-                correction_mag = max(penetration - slop, 0.0) * percent / inv_mass_sum
-                correction_mag = min(correction_mag, self.max_penetration_correction)
-                if not math.isfinite(correction_mag):
-                    continue
-                correction = (normal[0] * correction_mag, normal[1] * correction_mag)
-                if a.can_move:
-                    a.pose = a.pose.translated(-correction[0] * inv_mass_a, -correction[1] * inv_mass_a)
-                if b.can_move:
-                    b.pose = b.pose.translated(correction[0] * inv_mass_b, correction[1] * inv_mass_b)
-                # relative velocity
-                rvx = a.state.linear_velocity[0] - b.state.linear_velocity[0]
-                rvy = a.state.linear_velocity[1] - b.state.linear_velocity[1]
-                vel_along_normal = rvx * normal[0] + rvy * normal[1]
-                if vel_along_normal > 0 or not math.isfinite(vel_along_normal):
-                    continue
-                restitution = max(getattr(a.material, "restitution", 0.1), getattr(b.material, "restitution", 0.1))
-                restitution = max(0.0, min(1.0, restitution))
-                j = -(1 + restitution) * vel_along_normal
-                j /= inv_mass_sum
-                if not math.isfinite(j):
-                    continue
-                impulse = (j * normal[0], j * normal[1])
-                if a.can_move:
-                    a.state.linear_velocity = (
-                        a.state.linear_velocity[0] - inv_mass_a * impulse[0],
-                        a.state.linear_velocity[1] - inv_mass_a * impulse[1],
-                    )
-                if b.can_move:
-                    b.state.linear_velocity = (
-                        b.state.linear_velocity[0] + inv_mass_b * impulse[0],
-                        b.state.linear_velocity[1] + inv_mass_b * impulse[1],
-                    )
-                # friction (Coulomb)
-                rvx = a.state.linear_velocity[0] - b.state.linear_velocity[0]
-                rvy = a.state.linear_velocity[1] - b.state.linear_velocity[1]
-                tangent = (-normal[1], normal[0])
-                vt = rvx * tangent[0] + rvy * tangent[1]
-                jt = -vt / inv_mass_sum
-                if not math.isfinite(jt):
-                    continue
-                mu = 0.5 * (getattr(a.material, "friction", 0.6) + getattr(b.material, "friction", 0.6))
-                jt_limit = mu * abs(j)
+        if self._indexed_body_version != self._bodies.version:
+            self._index_bodies()
+        pairs = self._contact_pairs()
+        if not pairs:
+            return
+        bodies = self._body_list
+        # Per-step invariants: inverse masses and solver tunables are fixed for the whole pass. Static bodies
+        # always have zero inverse mass, so only the movable entries are divided out.
+        inv_masses = [0.0] * len(bodies)
+        for idx in self._dynamic_indices:
+            inv_masses[idx] = 1.0 / max(bodies[idx].state.mass, 1e-6)
+        percent = self.contact_correction_percent
+        slop = self.contact_slop
+        max_correction = self.max_penetration_correction
+        restitutions = self._body_restitution
+        frictions = self._body_friction
+        manifold_cache = self._manifold_cache
+        if len(manifold_cache) > max(256, 4 * len(pairs)):
+            # Entries for pairs the broad phase no longer reports (a robot that drove past walls) are dead weight.
+            manifold_cache.clear()
+        pair_coefficients = self._pair_coefficients
+        jacobi = self.contact_jacobi_positions
+        woken = self._woken_bodies if self.sleep_velocity > 0.0 else None
+        pending: Dict[int, List[float]] = {}
+        for i, k in pairs:
+            a = bodies[i]
+            a_moves = a.can_move
+            inv_mass_a = inv_masses[i]
+            b = bodies[k]
+            b_moves = b.can_move
+            pose_a = a.pose
+            pose_b = b.pose
+            key = (i, k)
+            cached = manifold_cache.get(key)
+            if cached is not None and cached[0] is pose_a and cached[1] is pose_b:
+                manifold = cached[2]
+            else:
+                manifold = collision_manifold(a.shape, pose_a, b.shape, pose_b)
+                manifold_cache[key] = (pose_a, pose_b, manifold)
+            if not manifold:
+                continue
+            nx, ny = manifold.normal
+            penetration = manifold.penetration
+            inv_mass_b = inv_masses[k]
+            inv_mass_sum = inv_mass_a + inv_mass_b
+            if inv_mass_sum == 0:
+                continue
+            if woken is not None:
+                if a_moves:
+                    woken.add(i)
+                if b_moves:
+                    woken.add(k)
+            # positional correction (baumgarte-ish)
+            correction_mag = max(penetration - slop, 0.0) * percent / inv_mass_sum
+            correction_mag = min(correction_mag, max_correction)
+            if not math.isfinite(correction_mag):
+                continue
+            cx = nx * correction_mag
+            cy = ny * correction_mag
+            if jacobi:
+                if a_moves:
+                    delta = pending.setdefault(i, [0.0, 0.0])
+                    delta[0] -= cx * inv_mass_a
+                    delta[1] -= cy * inv_mass_a
+                if b_moves:
+                    delta = pending.setdefault(k, [0.0, 0.0])
+                    delta[0] += cx * inv_mass_b
+                    delta[1] += cy * inv_mass_b
+            else:
+                if a_moves:
+                    a.pose = a.pose.translated(-cx * inv_mass_a, -cy * inv_mass_a)
+                if b_moves:
+                    b.pose = b.pose.translated(cx * inv_mass_b, cy * inv_mass_b)
+            # relative velocity
+            avx, avy = a.state.linear_velocity
+            bvx, bvy = b.state.linear_velocity
+            rvx = avx - bvx
+            rvy = avy - bvy
+            vel_along_normal = rvx * nx + rvy * ny
+            if vel_along_normal > 0:
+                continue
+            coefficients = pair_coefficients.get(key)
+            if coefficients is None:
+                # Per-body restitution is pre-clamped to [0, 1]; clamping is monotone, so the max needs no re-clamp.
+                coefficients = (max(restitutions[i], restitutions[k]), 0.5 * (frictions[i] + frictions[k]))
+                pair_coefficients[key] = coefficients
+            restitution, mu = coefficients
+            jn = -(1 + restitution) * vel_along_normal
+            jn /= inv_mass_sum
+            # Also catches a non-finite vel_along_normal (NaN/inf propagate into jn).
+            if not math.isfinite(jn):
+                continue
+            # friction (Coulomb) along the tangent (-ny, nx). The normal impulse has no tangential component,
+            # so the pre-impulse relative velocity already gives the post-impulse tangential speed.
+            vt = rvx * -ny + rvy * nx
+            jt = -vt / inv_mass_sum
+            if math.isfinite(jt):
+                jt_limit = mu * abs(jn)
                 jt = max(-jt_limit, min(jt_limit, jt))
-                t_impulse = (jt * tangent[0], jt * tangent[1])
-                if a.can_move:
-                    a.state.linear_velocity = (
-                        a.state.linear_velocity[0] - inv_mass_a * t_impulse[0],
-                        a.state.linear_velocity[1] - inv_mass_a * t_impulse[1],
-                    )
-                if b.can_move:
-                    b.state.linear_velocity = (
-                        b.state.linear_velocity[0] + inv_mass_b * t_impulse[0],
-                        b.state.linear_velocity[1] + inv_mass_b * t_impulse[1],
-                    )
-                if a.can_move:
-                    self._sanitize_velocity(a)
-                if b.can_move:
-                    self._sanitize_velocity(b)
+                # Normal and friction impulses combined, applied with one velocity write per body.
+                ix = jn * nx - jt * ny
+                iy = jn * ny + jt * nx
+            else:
+                ix = jn * nx
+                iy = jn * ny
+            if a_moves:
+                a.state.linear_velocity = (avx - inv_mass_a * ix, avy - inv_mass_a * iy)
+                self._sanitize_velocity(a)
+            if b_moves:
+                b.state.linear_velocity = (bvx + inv_mass_b * ix, bvy + inv_mass_b * iy)
+                self._sanitize_velocity(b)
+
+        for idx, (dx, dy) in pending.items():
+            body = bodies[idx]
+            pose = body.pose
+            body.pose = Pose2D(pose.x + dx, pose.y + dy, pose.theta)
 
     # --- Snapshot --------------------------------------------------------
     def snapshot(self) -> SnapshotState:
         body_state = {}
-        for name, body in self.bodies.items():
+        if self._indexed_body_version != self._bodies.version:
+            self._index_bodies()
+        for name, body in self._body_entries:
             body_state[name] = {
                 "pose": body.pose.as_dict(),
                 "lin_vel": body.state.linear_velocity,
@@ -968,8 +1474,10 @@ class Simulator:
                 body.clear_impulses()
         if set_as_spawn and cfg:
             cfg.spawn_pose = spawn_pose
+        # A teleport breaks temporal coherence, so warm-start state is dropped with the accumulators.
         for jr in self.joints:
             jr.lambda_accum = 0.0
+            jr.warm_lambda = 0.0
 
     def reset_to_spawn(self, robot_id: Optional[str] = None) -> None:
         """Return robot to the configured spawn pose and clear velocities."""
@@ -981,6 +1489,8 @@ class Simulator:
 
     # --- Helpers for sensors expecting a world-like interface -----------
     def __iter__(self) -> Iterable[SimObject]:
+        if self._indexed_body_version == self._bodies.version:
+            return iter(self._body_list)
         return iter(self.bodies.values())
 
     @property
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Sequence, Tuple
+from typing import Dict, Sequence, Set, Tuple
 
 try:  # pragma: no cover - pygame availability depends on host
     import pygame
@@ -45,24 +45,25 @@ class ManualDifferentialController:
 
     def command_from_keys(self, pressed: Sequence[bool]) -> ManualCommand:
         """Return wheel commands plus whether to hold position."""
-        self._update_speed_scale(pressed)
+        active = self._pressed_actions(pressed)
+        self._update_speed_scale(active)
 
         throttle = 0.0
-        if self._any_pressed(pressed, "forward"):
+        if "forward" in active:
             throttle += 1.0
-        if self._any_pressed(pressed, "backward"):
+        if "backward" in active:
             throttle -= 1.0
 
         turn = 0.0
-        if self._any_pressed(pressed, "left"):
+        if "left" in active:
             turn += 1.0
-        if self._any_pressed(pressed, "right"):
+        if "right" in active:
             turn -= 1.0
 
-        if self._any_pressed(pressed, "brake"):
+        if "brake" in active:
             return ManualCommand(0.0, 0.0, True)
 
-        boost = self.boost_multiplier if self._any_pressed(pressed, "boost") else 1.0
+        boost = self.boost_multiplier if "boost" in active else 1.0
         linear = throttle * (self.max_speed * self.speed_scale) * boost
         angular = turn * (self.turn_speed * self.speed_scale)
 
@@ -71,18 +72,24 @@ class ManualDifferentialController:
         hold = throttle == 0.0 and turn == 0.0
         return ManualCommand(left, right, hold)
 
-    def _any_pressed(self, pressed: Sequence[bool], action: str) -> bool:
-        keys = self.keymap.get(action, ())
-        return any(pressed[key] for key in keys)
-
-    def _update_speed_scale(self, pressed: Sequence[bool]) -> None:
-        if self._edge_triggered(pressed, "faster"):
+    def _pressed_actions(self, pressed: Sequence[bool]) -> Set[str]:
+        """Resolve the keymap against this frame's key state once; later checks are set lookups."""
+        active: Set[str] = set()
+        for action, keys in self.keymap.items():
+            for key in keys:
+                if pressed[key]:
+                    active.add(action)
+                    break
+        return active
+
+    def _update_speed_scale(self, active: Set[str]) -> None:
+        if self._edge_triggered(active, "faster"):
             self.speed_scale = min(self.max_speed_scale, self.speed_scale + 0.1)
-        if self._edge_triggered(pressed, "slower"):
+        if self._edge_triggered(active, "slower"):
             self.speed_scale = max(self.min_speed_scale, self.speed_scale - 0.1)
 
-    def _edge_triggered(self, pressed: Sequence[bool], action: str) -> bool:
-        current = self._any_pressed(pressed, action)
+    def _edge_triggered(self, active: Set[str], action: str) -> bool:
+        current = action in active
         previous = self._edge_cache.get(action, False)
         self._edge_cache[action] = current
         return current and not previous
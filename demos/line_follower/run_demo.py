@@ -20,6 +20,18 @@ from demos.line_follower.controller import LineFollowerController
 WORLD_HALF_WIDTH = 1.5
 WORLD_HALF_HEIGHT = 1.0
 
+# The arena outline never changes, so its overlay segments are built once and shared by every frame.
+_ARENA_CORNERS = (
+    (-WORLD_HALF_WIDTH, -WORLD_HALF_HEIGHT),
+    (WORLD_HALF_WIDTH, -WORLD_HALF_HEIGHT),
+    (WORLD_HALF_WIDTH, WORLD_HALF_HEIGHT),
+    (-WORLD_HALF_WIDTH, WORLD_HALF_HEIGHT),
+)
+ARENA_SEGMENTS = tuple(
+    OverlaySegment(start=start, end=end, color=(230, 230, 230))
+    for start, end in zip(_ARENA_CORNERS, _ARENA_CORNERS[1:] + _ARENA_CORNERS[:1])
+)
+
 
 def build_world() -> World:
     world = World(name="line_demo", random_seed=123, default_dt=0.05)
@@ -70,14 +82,7 @@ def run_demo() -> None:
 
     def overlay_provider(world: World) -> OverlayData:
         data = OverlayData()
-        corners = [
-            (-WORLD_HALF_WIDTH, -WORLD_HALF_HEIGHT),
-            (WORLD_HALF_WIDTH, -WORLD_HALF_HEIGHT),
-            (WORLD_HALF_WIDTH, WORLD_HALF_HEIGHT),
-            (-WORLD_HALF_WIDTH, WORLD_HALF_HEIGHT),
-        ]
-        for start, end in zip(corners, corners[1:] + corners[:1]):
-            data.segments.append(OverlaySegment(start=start, end=end, color=(230, 230, 230)))
+        data.extend_segments(ARENA_SEGMENTS)
         return data
 
     instructions = (
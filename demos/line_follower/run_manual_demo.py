@@ -11,11 +11,11 @@ if str(PACKAGE_ROOT) not in sys.path:
 import pygame
 
 from low_level_mechanics.world import World
-from low_level_mechanics.visualizer import Visualizer, OverlayData, OverlaySegment
+from low_level_mechanics.visualizer import Visualizer, OverlayData
 
 from demos.line_follower.manual_controller import ManualCommand, ManualDifferentialController
 from demos.line_follower.robot import spawn_robot
-from demos.line_follower.run_demo import WORLD_HALF_HEIGHT, WORLD_HALF_WIDTH, build_world
+from demos.line_follower.run_demo import ARENA_SEGMENTS, build_world
 
 
 def run_manual_demo() -> None:
@@ -66,14 +66,7 @@ def run_manual_demo() -> None:
 
 
 def _append_arena_bounds(data: OverlayData) -> None:
-    corners = [
-        (-WORLD_HALF_WIDTH, -WORLD_HALF_HEIGHT),
-        (WORLD_HALF_WIDTH, -WORLD_HALF_HEIGHT),
-        (WORLD_HALF_WIDTH, WORLD_HALF_HEIGHT),
-        (-WORLD_HALF_WIDTH, WORLD_HALF_HEIGHT),
-    ]
-    for start, end in zip(corners, corners[1:] + corners[:1]):
-        data.segments.append(OverlaySegment(start=start, end=end, color=(230, 230, 230)))
+    data.extend_segments(ARENA_SEGMENTS)
 
 
 def _sample_sensors(ctx, world: World, dt: float) -> None:
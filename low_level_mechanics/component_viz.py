@@ -3,7 +3,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import math
-from typing import Any, Callable, Dict, Iterable, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import weakref
 
 import pygame
 
@@ -12,6 +13,25 @@ from .world import Pose2D
 Color = Tuple[int, int, int]
 Point = Tuple[float, float]
 
+# Icon outlines in the component frame, built once rather than per draw.
+_ICON_SIZE = 0.025
+_DISTANCE_ICON: Tuple[Point, ...] = (
+    (_ICON_SIZE * 1.5, 0.0),
+    (-_ICON_SIZE * 0.6, _ICON_SIZE * 0.8),
+    (-_ICON_SIZE * 0.6, -_ICON_SIZE * 0.8),
+)
+_SENSOR_ICON: Tuple[Point, ...] = (
+    (0.0, _ICON_SIZE),
+    (_ICON_SIZE, 0.0),
+    (0.0, -_ICON_SIZE),
+    (-_ICON_SIZE, 0.0),
+)
+
+# Sensor value -> colour ramp, quantised to 256 steps over [0, 1].
+_COLOR_LUT: Tuple[Color, ...] = tuple(
+    (int(80 + 170 * t / 255), int(70 + 40 * t / 255), int(220 - 120 * t / 255)) for t in range(256)
+)
+
 
 @dataclass(frozen=True)
 class ComponentToggleState:
@@ -20,6 +40,11 @@ class ComponentToggleState:
     numeric_labels: bool = False
 
 
+_Renderer = Callable[[Pose2D, Dict[str, Any], "_DrawContext"], None]
+# Per-component dispatch: (visual tag, renderer or None, toggle the renderer needs or None).
+_Dispatch = Tuple[str, Optional[_Renderer], Optional[str]]
+
+
 class _DrawContext:
     def __init__(
         self,
@@ -34,6 +59,8 @@ class _DrawContext:
         self.scale = scale
         self.font = font
         self.toggles = toggles
+        # Screen rects touched while drawing, for partial display updates.
+        self.dirty: List[pygame.Rect] = []
 
 
 class ComponentVisualizer:
@@ -47,13 +74,24 @@ class ComponentVisualizer:
 
     def __init__(self, surface: pygame.Surface) -> None:
         self.surface = surface
-        self._renderers: Dict[str, Callable[[Pose2D, Dict[str, Any], _DrawContext], None]] = {
+        self._renderers: Dict[str, _Renderer] = {
             "motor.wheel": self._render_wheel_motor,
             "sensor.line": self._render_line_sensor,
             "sensor.line_array": self._render_line_array,
             "sensor.distance": self._render_distance_sensor,
             "sensor.imu": self._render_imu_sensor,
         }
+        # Toggle each renderer needs to draw anything; when it is off the
+        # component's visual_state() is never queried.
+        self._renderer_toggle_req: Dict[str, str] = {
+            "sensor.line": "sensor_details",
+            "sensor.line_array": "sensor_details",
+            "sensor.distance": "sensor_details",
+            "sensor.imu": "numeric_labels",
+        }
+        # (tag, renderer, required toggle) resolved once per component. Nothing bound
+        # to the component itself is stored, so the weak keys never get pinned.
+        self._dispatch: "weakref.WeakKeyDictionary[Any, Optional[_Dispatch]]" = weakref.WeakKeyDictionary()
 
     def draw_for_object(
         self,
@@ -63,24 +101,45 @@ class ComponentVisualizer:
         scale: float,
         font: pygame.font.Font,
         toggles: ComponentToggleState,
-    ) -> None:
+    ) -> List[pygame.Rect]:
+        """Draw every tagged component of ``obj``; returns the screen rects touched."""
         components: Iterable[Any] = getattr(obj, "components", ())  # type: ignore[assignment]
         ctx = _DrawContext(self.surface, world_to_screen, scale, font, toggles)
         for component in components or ():
-            tag = getattr(component, "visual_tag", None)
-            if not tag:
+            dispatch = self._dispatch_for(component)
+            if dispatch is None:
+                continue
+            tag, renderer, req = dispatch
+            if req and not getattr(toggles, req):
+                renderer = None
+            if renderer is None and not toggles.icons:
                 continue
             state_fn = getattr(component, "visual_state", None)
             pose_fn = getattr(component, "world_pose", None)
             if not callable(state_fn) or not callable(pose_fn):
                 continue
             pose = pose_fn()
-            state = state_fn() or {}
             if toggles.icons:
                 self._draw_icon(tag, pose, ctx)
-            renderer = self._renderers.get(tag)
-            if renderer:
-                renderer(pose, state, ctx)
+            if renderer is not None:
+                renderer(pose, state_fn() or {}, ctx)
+        return ctx.dirty
+
+    def _dispatch_for(self, component: Any) -> Optional[_Dispatch]:
+        try:
+            return self._dispatch[component]
+        except KeyError:
+            dispatch = self._resolve_dispatch(component)
+            self._dispatch[component] = dispatch
+            return dispatch
+        except TypeError:  # not weak-referenceable
+            return self._resolve_dispatch(component)
+
+    def _resolve_dispatch(self, component: Any) -> Optional[_Dispatch]:
+        tag = getattr(component, "visual_tag", None)
+        if not tag:
+            return None
+        return (tag, self._renderers.get(tag), self._renderer_toggle_req.get(tag))
 
     def _draw_icon(self, tag: str, pose: Pose2D, ctx: _DrawContext) -> None:
         group = tag.split(".", 1)[0]
@@ -92,7 +151,7 @@ class ComponentVisualizer:
         else:
             radius = max(3, int(ctx.scale * 0.015))
             center = ctx.world_to_screen((pose.x, pose.y))
-            pygame.draw.circle(ctx.surface, color, center, radius)
+            ctx.dirty.append(pygame.draw.circle(ctx.surface, color, center, radius))
 
     # --- Renderers -----------------------------------------------------
 
@@ -104,18 +163,19 @@ class ComponentVisualizer:
         arrow_length = base_length * (0.55 + 0.45 * magnitude)
         rim_r = max(3, int(ctx.scale * 0.012))
         hub_screen = ctx.world_to_screen((pose.x, pose.y))
-        pygame.draw.circle(ctx.surface, (28, 34, 42), hub_screen, rim_r)
+        ctx.dirty.append(pygame.draw.circle(ctx.surface, (28, 34, 42), hub_screen, rim_r))
         pygame.draw.circle(ctx.surface, (90, 120, 150), hub_screen, rim_r, 2)
-        start_world = pose.transform_point((0.02 * direction, 0.0))
-        end_world = pose.transform_point(((arrow_length + 0.02) * direction, 0.0))
+        start_world, end_world = pose.transform_points(
+            ((0.02 * direction, 0.0), ((arrow_length + 0.02) * direction, 0.0))
+        )
         start = ctx.world_to_screen(start_world)
         end = ctx.world_to_screen(end_world)
         color = (120, 255, 140) if command >= 0 else (255, 120, 120)
-        pygame.draw.line(ctx.surface, color, start, end, 3)
+        ctx.dirty.append(pygame.draw.line(ctx.surface, color, start, end, 3))
         self._draw_arrow_head(start_world, end_world, color, ctx)
         if ctx.toggles.numeric_labels:
             label = f"{command:+.2f}"
-            ctx.surface.blit(ctx.font.render(label, True, color), (end[0] + 4, end[1] - 12))
+            ctx.dirty.append(ctx.surface.blit(ctx.font.render(label, True, color), (end[0] + 4, end[1] - 12)))
 
     def _render_line_sensor(self, pose: Pose2D, state: Dict[str, Any], ctx: _DrawContext) -> None:
         if not ctx.toggles.sensor_details:
@@ -124,77 +184,67 @@ class ComponentVisualizer:
         point = state.get("point", (pose.x, pose.y))
         color = self._value_to_color(value)
         radius = max(3, int(ctx.scale * 0.01))
-        pygame.draw.circle(ctx.surface, color, ctx.world_to_screen(point), radius)
+        sx, sy = ctx.world_to_screen(point)
+        ctx.dirty.append(pygame.draw.circle(ctx.surface, color, (sx, sy), radius))
         if ctx.toggles.numeric_labels:
-            ctx.surface.blit(ctx.font.render(f"{value:.2f}", True, color), (ctx.world_to_screen(point)[0] + 6, ctx.world_to_screen(point)[1] - 10))
+            ctx.dirty.append(ctx.surface.blit(ctx.font.render(f"{value:.2f}", True, color), (sx + 6, sy - 10)))
 
     def _render_line_array(self, pose: Pose2D, state: Dict[str, Any], ctx: _DrawContext) -> None:
         if not ctx.toggles.sensor_details:
             return
         points = state.get("points", [])
         values = state.get("values", [])
+        radius = max(3, int(ctx.scale * 0.01))
+        surface = ctx.surface
+        world_to_screen = ctx.world_to_screen
+        value_to_color = self._value_to_color
+        draw_circle = pygame.draw.circle
+        mark = ctx.dirty.append
         for point, value in zip(points, values):
-            color = self._value_to_color(value)
-            radius = max(3, int(ctx.scale * 0.01))
-            pygame.draw.circle(ctx.surface, color, ctx.world_to_screen(point), radius)
+            mark(draw_circle(surface, value_to_color(value), world_to_screen(point), radius))
 
     def _render_distance_sensor(self, pose: Pose2D, state: Dict[str, Any], ctx: _DrawContext) -> None:
         if not ctx.toggles.sensor_details:
             return
-        start = ctx.world_to_screen(state.get("start", (pose.x, pose.y)))
-        end = ctx.world_to_screen(state.get("end", (pose.x, pose.y)))
+        origin = (pose.x, pose.y)
+        start = ctx.world_to_screen(state.get("start", origin))
+        end = ctx.world_to_screen(state.get("end", origin))
         hit = bool(state.get("hit", False))
         color = (255, 100, 120) if hit else (140, 255, 170)
-        pygame.draw.line(ctx.surface, color, start, end, 2)
+        ctx.dirty.append(pygame.draw.line(ctx.surface, color, start, end, 2))
         if ctx.toggles.numeric_labels:
             distance = float(state.get("distance", 0.0))
-            ctx.surface.blit(ctx.font.render(f"{distance:.2f}m", True, color), (end[0] + 4, end[1] - 12))
+            ctx.dirty.append(ctx.surface.blit(ctx.font.render(f"{distance:.2f}m", True, color), (end[0] + 4, end[1] - 12)))
 
     def _render_imu_sensor(self, pose: Pose2D, state: Dict[str, Any], ctx: _DrawContext) -> None:
         if not ctx.toggles.numeric_labels:
             return
-        text = f"vx:{state.get('lin', (0.0, 0.0))[0]:+.2f} vy:{state.get('lin', (0.0, 0.0))[1]:+.2f} ω:{state.get('ang', 0.0):+.2f}"
+        lin = state.get("lin", (0.0, 0.0))
+        text = f"vx:{lin[0]:+.2f} vy:{lin[1]:+.2f} ω:{state.get('ang', 0.0):+.2f}"
         pos = ctx.world_to_screen((pose.x, pose.y))
-        ctx.surface.blit(ctx.font.render(text, True, (220, 220, 220)), (pos[0] + 8, pos[1] + 4))
+        ctx.dirty.append(ctx.surface.blit(ctx.font.render(text, True, (220, 220, 220)), (pos[0] + 8, pos[1] + 4)))
 
     # --- Helpers -------------------------------------------------------
 
     @staticmethod
     def _value_to_color(value: float) -> Color:
-        clamped = max(0.0, min(1.0, float(value)))
-        return (
-            int(80 + 170 * clamped),
-            int(70 + 40 * clamped),
-            int(220 - 120 * clamped),
-        )
-
+        value = float(value)
+        return _COLOR_LUT[0 if value <= 0.0 else 255 if not value < 1.0 else int(value * 255)]
 
     def _draw_motor_icon(self, pose: Pose2D, color: Color, ctx: _DrawContext) -> None:
         radius = max(4, int(ctx.scale * 0.018))
         center_world = (pose.x, pose.y)
         center = ctx.world_to_screen(center_world)
-        pygame.draw.circle(ctx.surface, color, center, radius)
+        ctx.dirty.append(pygame.draw.circle(ctx.surface, color, center, radius))
         pygame.draw.circle(ctx.surface, (26, 26, 26), center, max(2, radius // 2), 2)
         spoke_end = ctx.world_to_screen(pose.transform_point((0.05, 0.0)))
-        pygame.draw.line(ctx.surface, (18, 18, 18), center, spoke_end, 2)
+        ctx.dirty.append(pygame.draw.line(ctx.surface, (18, 18, 18), center, spoke_end, 2))
 
     def _draw_sensor_icon(self, tag: str, pose: Pose2D, color: Color, ctx: _DrawContext) -> None:
-        size = 0.025
-        if tag == "sensor.distance":
-            local = [
-                (size * 1.5, 0.0),
-                (-size * 0.6, size * 0.8),
-                (-size * 0.6, -size * 0.8),
-            ]
-        else:
-            local = [
-                (0.0, size),
-                (size, 0.0),
-                (0.0, -size),
-                (-size, 0.0),
-            ]
-        points = [ctx.world_to_screen(pose.transform_point(pt)) for pt in local]
-        pygame.draw.polygon(ctx.surface, color, points)
+        local = _DISTANCE_ICON if tag == "sensor.distance" else _SENSOR_ICON
+        world_to_screen = ctx.world_to_screen
+        points = [world_to_screen(pt) for pt in pose.transform_points(local)]
+        ctx.dirty.append(pygame.draw.polygon(ctx.surface, color, points))
 
     def _draw_arrow_head(self, start: Point, end: Point, color: Color, ctx: _DrawContext) -> None:
         vx = end[0] - start[0]
@@ -216,18 +266,9 @@ class ComponentVisualizer:
             end[0] - nx * head_len - px * head_half_width,
             end[1] - ny * head_len - py * head_half_width,
         )
-        tip = ctx.world_to_screen(end)
-        left_px = ctx.world_to_screen(left)
-        right_px = ctx.world_to_screen(right)
-        pygame.draw.polygon(ctx.surface, color, [tip, left_px, right_px])
-
-    @staticmethod
-    def _value_to_color(value: float) -> Color:
-        clamped = max(0.0, min(1.0, float(value)))
-        return (
-            int(80 + 170 * clamped),
-            int(70 + 40 * clamped),
-            int(220 - 120 * clamped),
+        world_to_screen = ctx.world_to_screen
+        ctx.dirty.append(
+            pygame.draw.polygon(ctx.surface, color, [world_to_screen(end), world_to_screen(left), world_to_screen(right)])
         )
 
 
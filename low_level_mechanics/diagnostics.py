@@ -1,8 +1,9 @@
 """Diagnostics utilities for capturing world/object state."""
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional
 
 from .world import World
 
@@ -30,10 +31,14 @@ class Snapshot:
 
 
 class SnapshotLogger:
-    """Collects snapshots for later visualization or debugging."""
+    """Collects snapshots for later visualization or debugging.
 
-    def __init__(self) -> None:
-        self._snapshots: List[Snapshot] = []
+    ``max_len`` bounds the history for long runs: once full, each new snapshot
+    evicts the oldest one.
+    """
+
+    def __init__(self, max_len: Optional[int] = None) -> None:
+        self._snapshots: Deque[Snapshot] = deque(maxlen=max_len)
 
     def record(
         self,
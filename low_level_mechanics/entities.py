@@ -22,15 +22,32 @@ class DynamicState:
 
     def advance_pose(self, pose: Pose2D, dt: float) -> Pose2D:
         vx, vy = self.linear_velocity
-        new_pose = pose.translated(vx * dt, vy * dt)
-        if self.angular_velocity:
-            new_pose = new_pose.rotated(self.angular_velocity * dt)
-        return new_pose
+        omega = self.angular_velocity
+        # One Pose2D per step; same arithmetic as translated() followed by rotated().
+        theta = pose.theta + omega * dt if omega else pose.theta
+        return Pose2D(pose.x + vx * dt, pose.y + vy * dt, theta)
 
 
 class SimObject:
     """Physical or logical object placed into the world."""
 
+    # Fixed attribute set: the physics loops read these on every body every step.
+    __slots__ = (
+        "name",
+        "pose",
+        "shape",
+        "material",
+        "can_move",
+        "state",
+        "metadata",
+        "world",
+        "_pending_fx",
+        "_pending_fy",
+        "_pending_torque",
+        "_components",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         *,
@@ -50,7 +67,8 @@ class SimObject:
         self.state = dynamic_state or DynamicState()
         self.metadata: Dict[str, Any] = metadata or {}
         self.world: Optional["World"] = None
-        self._pending_forces: List[Tuple[float, float]] = []
+        self._pending_fx: float = 0.0
+        self._pending_fy: float = 0.0
         self._pending_torque: float = 0.0
         self._components: List[Any] = []
 
@@ -59,8 +77,7 @@ class SimObject:
 
     def on_removed_from_world(self) -> None:
         self.world = None
-        self._pending_forces.clear()
-        self._pending_torque = 0.0
+        self.clear_impulses()
         for component in tuple(self._components):
             detach = getattr(component, "detach", None)
             if callable(detach):
@@ -76,7 +93,8 @@ class SimObject:
         application_point: Optional[Tuple[float, float]] = None,
     ) -> None:
         """Apply a force, optionally at an offset to induce torque."""
-        self._pending_forces.append(force)
+        self._pending_fx += force[0]
+        self._pending_fy += force[1]
         if application_point is not None:
             cx, cy = self.pose.x, self.pose.y
             rx = application_point[0] - cx
@@ -88,23 +106,56 @@ class SimObject:
         self._pending_torque += torque
 
     def clear_impulses(self) -> None:
-        self._pending_forces.clear()
+        self._pending_fx = 0.0
+        self._pending_fy = 0.0
         self._pending_torque = 0.0
 
-    def integrate(self, dt: float) -> None:
+    def has_pending_forces(self) -> bool:
+        """True when a force or torque has been queued since the last integrate/clear."""
+        return bool(self._pending_fx or self._pending_fy or self._pending_torque)
+
+    def is_resting(self) -> bool:
+        """True when ``integrate`` (without extra force) would leave pose and velocity untouched."""
+        state = self.state
+        vx, vy = state.linear_velocity
+        return (
+            vx == 0.0
+            and vy == 0.0
+            and state.angular_velocity == 0.0
+            and not self._pending_fx
+            and not self._pending_fy
+            and not self._pending_torque
+        )
+
+    def integrate(self, dt: float, extra_force: Optional[Tuple[float, float]] = None) -> None:
+        """Advance one step; ``extra_force`` acts as if applied last (e.g. gravity) without queueing it."""
         if not self.can_move:
             self.clear_impulses()
             return
-        fx = sum(f[0] for f in self._pending_forces)
-        fy = sum(f[1] for f in self._pending_forces)
-        vx, vy = self.state.linear_velocity
-        if self.state.mass > 0:
-            vx += (fx / self.state.mass) * dt
-            vy += (fy / self.state.mass) * dt
-        self.state.linear_velocity = (vx, vy)
-        if self.state.moment_of_inertia > 0:
-            self.state.angular_velocity += (self._pending_torque / self.state.moment_of_inertia) * dt
-        self.pose = self.state.advance_pose(self.pose, dt)
+        fx = self._pending_fx
+        fy = self._pending_fy
+        if extra_force is not None:
+            fx += extra_force[0]
+            fy += extra_force[1]
+        state = self.state
+        vx, vy = state.linear_velocity
+        mass = state.mass
+        if mass > 0:
+            vx += (fx / mass) * dt
+            vy += (fy / mass) * dt
+        state.linear_velocity = (vx, vy)
+        omega = state.angular_velocity
+        inertia = state.moment_of_inertia
+        if inertia > 0:
+            omega += (self._pending_torque / inertia) * dt
+            state.angular_velocity = omega
+        # advance_pose inlined: the straight-line case skips the heading update, and a
+        # body that ends up motionless keeps its Pose2D so per-pose geometry caches stay warm.
+        pose = self.pose
+        if omega:
+            self.pose = Pose2D(pose.x + vx * dt, pose.y + vy * dt, pose.theta + omega * dt)
+        elif vx or vy:
+            self.pose = Pose2D(pose.x + vx * dt, pose.y + vy * dt, pose.theta)
         self.clear_impulses()
 
     def register_component(self, component: Any) -> None:
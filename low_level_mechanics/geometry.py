@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 import math
-from typing import List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from .world import Pose2D
 
@@ -51,16 +52,11 @@ class Shape2D:
         bbox_other = other.bounding_box(pose_other)
         if not bbox_self.intersects(bbox_other):
             return False
-        if isinstance(self, Circle) and isinstance(other, Circle):
-            return _circle_vs_circle(self, pose_self, other, pose_other)
-        if isinstance(self, Circle) and isinstance(other, Polygon):
-            return _circle_vs_polygon(self, pose_self, other, pose_other)
-        if isinstance(self, Polygon) and isinstance(other, Circle):
-            return _circle_vs_polygon(other, pose_other, self, pose_self)
-        if isinstance(self, Polygon) and isinstance(other, Polygon):
-            return _polygon_vs_polygon(self, pose_self, other, pose_other)
-        # Fallback to bounding boxes.
-        return True
+        test = _dispatch(_INTERSECT_DISPATCH, type(self), type(other))
+        if test is None:
+            # Fallback to bounding boxes.
+            return True
+        return test(self, pose_self, other, pose_other)
 
 
 @dataclass(frozen=True)
@@ -102,34 +98,73 @@ class Polygon(Shape2D):
             area += x1 * y2 - x2 * y1
         return abs(area) * 0.5
 
+    @cached_property
+    def local_centroid(self) -> Point2D:
+        """Vertex average in the polygon's own frame; poses only need to transform it."""
+        return _centroid(list(self.vertices))
+
     def _world_vertices(self, pose: Pose2D | None) -> List[Point2D]:
+        """World-space vertices for ``pose``; callers must treat the returned list as read-only.
+
+        The last result is memoized per pose object (Pose2D is immutable), so static bodies transform once.
+        """
         if pose is None:
             return list(self.vertices)
-        return [pose.transform_point(v) for v in self.vertices]
+        cache = self.__dict__.get("_world_cache")
+        if cache is not None and cache[0] is pose:
+            return cache[1]
+        verts = pose.transform_points(self.vertices)
+        # Frozen dataclass: bypass __setattr__ for this private cache slot.
+        object.__setattr__(self, "_world_cache", (pose, verts))
+        return verts
 
     def bounding_box(self, pose: Pose2D | None = None) -> BoundingBox:
-        verts = self._world_vertices(pose)
-        xs = [v[0] for v in verts]
-        ys = [v[1] for v in verts]
-        return BoundingBox(min(xs), min(ys), max(xs), max(ys))
+        if pose is not None:
+            # Broad phase and sensor prefilters ask for the same pose's box repeatedly; memoize it like the vertices.
+            cache = self.__dict__.get("_bbox_cache")
+            if cache is not None and cache[0] is pose:
+                return cache[1]
+        # zip(*) splits the coordinates in C instead of two Python-level comprehensions.
+        xs, ys = zip(*self._world_vertices(pose))
+        box = BoundingBox(min(xs), min(ys), max(xs), max(ys))
+        if pose is not None:
+            object.__setattr__(self, "_bbox_cache", (pose, box))
+        return box
 
     def contains_point(self, point: Point2D, pose: Pose2D | None = None) -> bool:
         local_point = point
         if pose is not None:
-            inv = pose.inverse()
+            # Ray marching probes one pose many times; keep its inverse alongside the world-vertex cache.
+            cache = self.__dict__.get("_inverse_cache")
+            if cache is not None and cache[0] is pose:
+                inv = cache[1]
+            else:
+                inv = pose.inverse()
+                object.__setattr__(self, "_inverse_cache", (pose, inv))
             local_point = inv.transform_point(point)
         winding = 0
         px, py = local_point
-        pts = self.vertices
-        for i in range(len(pts)):
-            x1, y1 = pts[i]
-            x2, y2 = pts[(i + 1) % len(pts)]
-            if y1 <= py < y2 or y2 <= py < y1:
-                x_cross = x1 + (py - y1) * (x2 - x1) / (y2 - y1 + 1e-12)
-                if px < x_cross:
-                    winding ^= 1
+        for lo, hi, x1, y1, dx, dy in self._crossing_edges():
+            if lo <= py < hi and px < x1 + (py - y1) * dx / dy:
+                winding ^= 1
         return winding == 1
 
+    def _crossing_edges(self) -> List[Tuple[float, float, float, float, float, float]]:
+        """Per-edge ``(lo, hi, x1, y1, dx, dy)`` for the ray-cast in ``contains_point``.
+
+        Horizontal edges can never straddle the ray and are left out; ``dy`` keeps
+        the original ``+ 1e-12`` guard so crossings are computed exactly as before.
+        """
+        edges = self.__dict__.get("_crossing_cache")
+        if edges is None:
+            edges = []
+            pts = self.vertices
+            for (x1, y1), (x2, y2) in zip(pts, list(pts[1:]) + [pts[0]]):
+                if y1 != y2:
+                    edges.append((min(y1, y2), max(y1, y2), x1, y1, x2 - x1, y2 - y1 + 1e-12))
+            object.__setattr__(self, "_crossing_cache", edges)
+        return edges
+
 
 def _circle_vs_circle(a: Circle, pose_a: Pose2D, b: Circle, pose_b: Pose2D) -> bool:
     dx = pose_a.x - pose_b.x
@@ -152,6 +187,10 @@ def _circle_vs_polygon(circle: Circle, pose_circle: Pose2D, polygon: Polygon, po
     return False
 
 
+def _polygon_vs_circle(a: Polygon, pose_a: Pose2D, b: Circle, pose_b: Pose2D) -> bool:
+    return _circle_vs_polygon(b, pose_b, a, pose_a)
+
+
 def _polygon_vs_polygon(a: Polygon, pose_a: Pose2D, b: Polygon, pose_b: Pose2D) -> bool:
     verts_a = a._world_vertices(pose_a)
     verts_b = b._world_vertices(pose_b)
@@ -159,28 +198,27 @@ def _polygon_vs_polygon(a: Polygon, pose_a: Pose2D, b: Polygon, pose_b: Pose2D)
 
 
 def _sat_overlap(verts_a: List[Point2D], verts_b: List[Point2D]) -> bool:
-    for i in range(len(verts_a)):
-        x1, y1 = verts_a[i]
-        x2, y2 = verts_a[(i + 1) % len(verts_a)]
-        edge_x = x2 - x1
-        edge_y = y2 - y1
-        normal = (-edge_y, edge_x)
-        min_a, max_a = _project(normal, verts_a)
-        min_b, max_b = _project(normal, verts_b)
-        if max_a < min_b or max_b < min_a:
+    # Walk edges pairwise (closing edge first) and project inline; the axis is
+    # normalised once per edge rather than once per projected polygon.
+    hypot = math.hypot
+    x1, y1 = verts_a[-1]
+    for x2, y2 in verts_a:
+        ax = y1 - y2
+        ay = x2 - x1
+        x1 = x2
+        y1 = y2
+        length = hypot(ax, ay) or 1.0
+        ax /= length
+        ay /= length
+        dots = [vx * ax + vy * ay for vx, vy in verts_a]
+        min_a = min(dots)
+        max_a = max(dots)
+        dots = [vx * ax + vy * ay for vx, vy in verts_b]
+        if max_a < min(dots) or max(dots) < min_a:
             return False
     return True
 
 
-def _project(axis: Point2D, verts: List[Point2D]) -> Tuple[float, float]:
-    ax, ay = axis
-    length = math.hypot(ax, ay) or 1.0
-    ax /= length
-    ay /= length
-    dots = [vx * ax + vy * ay for vx, vy in verts]
-    return min(dots), max(dots)
-
-
 def _distance_point_to_segment(point: Point2D, start: Point2D, end: Point2D) -> float:
     px, py = point
     sx, sy = start
@@ -209,19 +247,15 @@ def collision_manifold(
     shape_a: Shape2D, pose_a: Pose2D, shape_b: Shape2D, pose_b: Pose2D
 ) -> Optional[CollisionManifold]:
     """Compute a simple manifold (normal points from A to B)."""
-    if isinstance(shape_a, Circle) and isinstance(shape_b, Circle):
-        return _circle_vs_circle_manifold(shape_a, pose_a, shape_b, pose_b)
-    if isinstance(shape_a, Circle) and isinstance(shape_b, Polygon):
-        return _circle_vs_polygon_manifold(shape_a, pose_a, shape_b, pose_b)
-    if isinstance(shape_a, Polygon) and isinstance(shape_b, Circle):
-        manifold = _circle_vs_polygon_manifold(shape_b, pose_b, shape_a, pose_a)
-        if manifold:
-            n = manifold.normal
-            return CollisionManifold(normal=(-n[0], -n[1]), penetration=manifold.penetration, contact_point=manifold.contact_point)
+    solve = _dispatch(_MANIFOLD_DISPATCH, type(shape_a), type(shape_b))
+    if solve is None:
         return None
-    if isinstance(shape_a, Polygon) and isinstance(shape_b, Polygon):
-        return _polygon_vs_polygon_manifold(shape_a, pose_a, shape_b, pose_b)
-    return None
+    # Circle pairs already reject on squared centre distance before any sqrt.
+    if solve is not _circle_vs_circle_manifold and not shape_a.bounding_box(pose_a).intersects(
+        shape_b.bounding_box(pose_b)
+    ):
+        return None
+    return solve(shape_a, pose_a, shape_b, pose_b)
 
 
 def _circle_vs_circle_manifold(a: Circle, pose_a: Pose2D, b: Circle, pose_b: Pose2D) -> Optional[CollisionManifold]:
@@ -245,32 +279,30 @@ def _circle_vs_circle_manifold(a: Circle, pose_a: Pose2D, b: Circle, pose_b: Pos
 def _circle_vs_polygon_manifold(circle: Circle, pose_circle: Pose2D, polygon: Polygon, pose_polygon: Pose2D) -> Optional[CollisionManifold]:
     world_verts = polygon._world_vertices(pose_polygon)
     center = (pose_circle.x, pose_circle.y)
+    cx, cy = center
+    hypot = math.hypot
     closest_dist = float("inf")
     closest_point = None
-    # Check vertices
-    for vx, vy in world_verts:
-        d = math.hypot(center[0] - vx, center[1] - vy)
-        if d < closest_dist:
-            closest_dist = d
-            closest_point = (vx, vy)
-    # Check edges
-    for i in range(len(world_verts)):
-        start = world_verts[i]
-        end = world_verts[(i + 1) % len(world_verts)]
-        d = _distance_point_to_segment(center, start, end)
-        if d < closest_dist:
-            closest_dist = d
-            # project center to edge
-            sx, sy = start
-            ex, ey = end
-            dx = ex - sx
-            dy = ey - sy
-            if dx == 0 and dy == 0:
+    # Closest point over all edges; a foot clamped to an end of its segment is
+    # that vertex, so vertices need no separate pass.
+    for start, end in zip(world_verts, world_verts[1:] + world_verts[:1]):
+        sx, sy = start
+        ex, ey = end
+        dx = ex - sx
+        dy = ey - sy
+        if dx == 0 and dy == 0:
+            proj = start
+        else:
+            t = ((cx - sx) * dx + (cy - sy) * dy) / (dx * dx + dy * dy)
+            if t <= 0.0:
                 proj = start
+            elif t >= 1.0:
+                proj = end
             else:
-                t = ((center[0] - sx) * dx + (center[1] - sy) * dy) / (dx * dx + dy * dy)
-                t = max(0.0, min(1.0, t))
                 proj = (sx + t * dx, sy + t * dy)
+        d = hypot(cx - proj[0], cy - proj[1])
+        if d < closest_dist:
+            closest_dist = d
             closest_point = proj
     penetration = circle.radius - closest_dist
     if penetration <= 0.0 or closest_point is None:
@@ -283,44 +315,27 @@ def _circle_vs_polygon_manifold(circle: Circle, pose_circle: Pose2D, polygon: Po
     return CollisionManifold(normal=normal, penetration=penetration, contact_point=contact)
 
 
+def _polygon_vs_circle_manifold(a: Polygon, pose_a: Pose2D, b: Circle, pose_b: Pose2D) -> Optional[CollisionManifold]:
+    manifold = _circle_vs_polygon_manifold(b, pose_b, a, pose_a)
+    if manifold:
+        n = manifold.normal
+        return CollisionManifold(normal=(-n[0], -n[1]), penetration=manifold.penetration, contact_point=manifold.contact_point)
+    return None
+
+
 def _polygon_vs_polygon_manifold(a: Polygon, pose_a: Pose2D, b: Polygon, pose_b: Pose2D) -> Optional[CollisionManifold]:
     verts_a = a._world_vertices(pose_a)
     verts_b = b._world_vertices(pose_b)
-    penetration = float("inf")
-    best_axis = None
-    best_point = None
-
-    def _check_axes(verts1, verts2, current_penetration, current_axis, current_point):
-        pen = current_penetration
-        axis = current_axis
-        point = current_point
-        for i in range(len(verts1)):
-            x1, y1 = verts1[i]
-            x2, y2 = verts1[(i + 1) % len(verts1)]
-            edge_x = x2 - x1
-            edge_y = y2 - y1
-            normal = (-edge_y, edge_x)
-            min1, max1 = _project(normal, verts1)
-            min2, max2 = _project(normal, verts2)
-            overlap = min(max1, max2) - max(min1, min2)
-            if overlap <= 0:
-                return None, None, None
-            if overlap < pen:
-                pen = overlap
-                length = math.hypot(*normal) or 1.0
-                axis = (normal[0] / length, normal[1] / length)
-                point = verts1[i]
-        return pen, axis, point
-
-    penetration, best_axis, best_point = _check_axes(verts_a, verts_b, penetration, best_axis, best_point)
-    if best_axis is None:
+    found = _min_overlap_axis(verts_a, verts_b, float("inf"), None, None)
+    if found is None:
         return None
-    penetration, best_axis, best_point = _check_axes(verts_b, verts_a, penetration, best_axis, best_point)
-    if best_axis is None:
+    found = _min_overlap_axis(verts_b, verts_a, *found)
+    if found is None:
         return None
+    penetration, best_axis, best_point = found
     # normal from A to B: ensure direction points from A to B
-    center_a = _centroid(verts_a)
-    center_b = _centroid(verts_b)
+    center_a = pose_a.transform_point(a.local_centroid)
+    center_b = pose_b.transform_point(b.local_centroid)
     dir_ab = (center_b[0] - center_a[0], center_b[1] - center_a[1])
     if best_axis[0] * dir_ab[0] + best_axis[1] * dir_ab[1] < 0:
         best_axis = (-best_axis[0], -best_axis[1])
@@ -328,14 +343,80 @@ def _polygon_vs_polygon_manifold(a: Polygon, pose_a: Pose2D, b: Polygon, pose_b:
     return CollisionManifold(normal=best_axis, penetration=penetration, contact_point=contact)
 
 
+def _min_overlap_axis(
+    verts1: List[Point2D],
+    verts2: List[Point2D],
+    pen: float,
+    axis: Optional[Point2D],
+    point: Optional[Point2D],
+) -> Optional[Tuple[float, Optional[Point2D], Optional[Point2D]]]:
+    """Fold the edge normals of ``verts1`` into the running minimum-overlap axis.
+
+    Returns ``None`` as soon as a separating axis is found. Edges are visited in
+    index order so ties keep resolving to the same edge as before.
+    """
+    hypot = math.hypot
+    for start, (x2, y2) in zip(verts1, verts1[1:] + verts1[:1]):
+        x1, y1 = start
+        ax = y1 - y2
+        ay = x2 - x1
+        length = hypot(ax, ay) or 1.0
+        ax /= length
+        ay /= length
+        dots = [vx * ax + vy * ay for vx, vy in verts1]
+        min1 = min(dots)
+        max1 = max(dots)
+        dots = [vx * ax + vy * ay for vx, vy in verts2]
+        min2 = min(dots)
+        max2 = max(dots)
+        overlap = (max1 if max1 < max2 else max2) - (min1 if min1 > min2 else min2)
+        if overlap <= 0:
+            return None
+        if overlap < pen:
+            pen = overlap
+            axis = (ax, ay)
+            point = start
+    return pen, axis, point
+
+
 def _centroid(verts: List[Point2D]) -> Point2D:
     if not verts:
         return (0.0, 0.0)
-    xs = [v[0] for v in verts]
-    ys = [v[1] for v in verts]
+    xs, ys = zip(*verts)
     return (sum(xs) / len(xs), sum(ys) / len(ys))
 
 
+# Narrow-phase routines keyed by exact shape types. Subclasses are resolved once
+# through ``_dispatch`` and then cached under their own types.
+_INTERSECT_DISPATCH: Dict[Tuple[type, type], Optional[Callable[..., bool]]] = {
+    (Circle, Circle): _circle_vs_circle,
+    (Circle, Polygon): _circle_vs_polygon,
+    (Polygon, Circle): _polygon_vs_circle,
+    (Polygon, Polygon): _polygon_vs_polygon,
+}
+
+_MANIFOLD_DISPATCH: Dict[Tuple[type, type], Optional[Callable[..., Optional[CollisionManifold]]]] = {
+    (Circle, Circle): _circle_vs_circle_manifold,
+    (Circle, Polygon): _circle_vs_polygon_manifold,
+    (Polygon, Circle): _polygon_vs_circle_manifold,
+    (Polygon, Polygon): _polygon_vs_polygon_manifold,
+}
+
+
+def _dispatch(table: Dict[Tuple[type, type], Optional[Callable[..., Any]]], type_a: type, type_b: type) -> Optional[Callable[..., Any]]:
+    try:
+        return table[(type_a, type_b)]
+    except KeyError:
+        pass
+    found = None
+    for (base_a, base_b), fn in list(table.items()):
+        if fn is not None and issubclass(type_a, base_a) and issubclass(type_b, base_b):
+            found = fn
+            break
+    table[(type_a, type_b)] = found
+    return found
+
+
 __all__ = [
     "Shape2D",
     "Circle",
@@ -2,20 +2,95 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Mapping, MutableMapping, Optional, Set
+from types import MappingProxyType
+from typing import AbstractSet, Dict, Hashable, Iterable, Mapping, Optional, Tuple
+from weakref import WeakValueDictionary
 
 
-@dataclass
+@dataclass(frozen=True)
 class MaterialProperties:
-    """Simple container for physical and signal-level attributes."""
+    """Simple container for physical and signal-level attributes.
+
+    Instances are immutable (tags become a frozenset, the mappings read-only views of
+    private copies), so one instance can safely be shared by many objects; derive
+    variants with ``with_overrides``.
+    """
 
     friction: float = 0.6
     restitution: float = 0.1
     reflectivity: float = 0.3
     traction: float = 0.6
-    permeability_tags: Set[str] = field(default_factory=set)
-    field_signals: MutableMapping[str, float] = field(default_factory=dict)
-    custom: MutableMapping[str, object] = field(default_factory=dict)
+    permeability_tags: AbstractSet[str] = field(default_factory=frozenset)
+    field_signals: Mapping[str, float] = field(default_factory=dict)
+    custom: Mapping[str, object] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "permeability_tags", frozenset(self.permeability_tags))
+        object.__setattr__(self, "field_signals", MappingProxyType(dict(self.field_signals)))
+        object.__setattr__(self, "custom", MappingProxyType(dict(self.custom)))
+
+    def __reduce__(self):
+        # Mapping proxies cannot be pickled; rebuild from plain copies (copy/deepcopy go through here too).
+        return (
+            type(self),
+            (
+                self.friction,
+                self.restitution,
+                self.reflectivity,
+                self.traction,
+                self.permeability_tags,
+                dict(self.field_signals),
+                dict(self.custom),
+            ),
+        )
+
+    @classmethod
+    def intern(
+        cls,
+        *,
+        friction: float = 0.6,
+        restitution: float = 0.1,
+        reflectivity: float = 0.3,
+        traction: float = 0.6,
+        permeability_tags: Iterable[str] = (),
+        field_signals: Optional[Mapping[str, float]] = None,
+        custom: Optional[Mapping[str, object]] = None,
+    ) -> "MaterialProperties":
+        """Shared instance for these settings.
+
+        Objects built with identical materials get the same instance back for as long as
+        one of them is alive. Unhashable custom values skip the registry.
+        """
+        tags = frozenset(permeability_tags)
+        signals = dict(field_signals or {})
+        extra = dict(custom or {})
+        key = (
+            friction,
+            restitution,
+            reflectivity,
+            traction,
+            tags,
+            _freeze(signals),
+            _freeze(extra),
+        )
+        try:
+            material = _INTERNED.get(key)
+        except TypeError:
+            key = None
+            material = None
+        if material is None:
+            material = cls(
+                friction=friction,
+                restitution=restitution,
+                reflectivity=reflectivity,
+                traction=traction,
+                permeability_tags=tags,
+                field_signals=signals,
+                custom=extra,
+            )
+            if key is not None:
+                _INTERNED[key] = material
+        return material
 
     def field_value(self, field_name: str, default: float = 0.0) -> float:
         return float(self.field_signals.get(field_name, default))
@@ -30,37 +105,57 @@ class MaterialProperties:
         restitution: Optional[float] = None,
         reflectivity: Optional[float] = None,
         traction: Optional[float] = None,
-        permeability_tags: Optional[Set[str]] = None,
+        permeability_tags: Optional[AbstractSet[str]] = None,
         field_signals: Optional[Mapping[str, float]] = None,
         custom: Optional[Mapping[str, object]] = None,
     ) -> "MaterialProperties":
-        updated = MaterialProperties(
+        signals = dict(self.field_signals)
+        if field_signals:
+            signals.update(field_signals)
+        extra = dict(self.custom)
+        if custom:
+            extra.update(custom)
+        return MaterialProperties.intern(
             friction=friction if friction is not None else self.friction,
             restitution=restitution if restitution is not None else self.restitution,
             reflectivity=reflectivity if reflectivity is not None else self.reflectivity,
             traction=traction if traction is not None else self.traction,
-            permeability_tags=set(permeability_tags)
-            if permeability_tags is not None
-            else set(self.permeability_tags),
+            permeability_tags=permeability_tags if permeability_tags is not None else self.permeability_tags,
+            field_signals=signals,
+            custom=extra,
         )
-        updated.field_signals.update(self.field_signals)
-        if field_signals:
-            updated.field_signals.update(field_signals)
-        updated.custom.update(self.custom)
-        if custom:
-            updated.custom.update(custom)
-        return updated
 
     def as_dict(self) -> Dict[str, object]:
+        # Frozen and usually interned, so the scalars and sorted tags are worked out once per
+        # instance; every call still hands out its own list and dicts.
+        cached = self.__dict__.get("_dict_cache")
+        if cached is None:
+            cached = (
+                {
+                    "friction": self.friction,
+                    "restitution": self.restitution,
+                    "reflectivity": self.reflectivity,
+                    "traction": self.traction,
+                },
+                tuple(sorted(self.permeability_tags)),
+            )
+            object.__setattr__(self, "_dict_cache", cached)
+        scalars, tags = cached
         return {
-            "friction": self.friction,
-            "restitution": self.restitution,
-            "reflectivity": self.reflectivity,
-            "traction": self.traction,
-            "permeability_tags": sorted(self.permeability_tags),
+            **scalars,
+            "permeability_tags": list(tags),
             "field_signals": dict(self.field_signals),
             "custom": dict(self.custom),
         }
 
 
+def _freeze(values: Mapping[str, object]) -> Tuple[Tuple[str, type, Hashable], ...]:
+    # The value type is part of the key so 1 and 1.0 (or True) do not share an instance.
+    return tuple(sorted((name, type(value), value) for name, value in values.items()))
+
+
+# Canonical field tuple -> live interned instance; entries drop with their last user.
+_INTERNED: "WeakValueDictionary[tuple, MaterialProperties]" = WeakValueDictionary()
+
+
 __all__ = ["MaterialProperties"]
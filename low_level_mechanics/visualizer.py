@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass, field
-from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 try:  # pragma: no cover - pygame import is environment specific
     import pygame
@@ -35,7 +35,7 @@ NAMED_COLORS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class OverlayPoint:
     position: Point
     color: Color = (255, 95, 95)
@@ -43,7 +43,7 @@ class OverlayPoint:
     label: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OverlaySegment:
     start: Point
     end: Point
@@ -51,7 +51,7 @@ class OverlaySegment:
     width: int = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class OverlayData:
     points: List[OverlayPoint] = field(default_factory=list)
     segments: List[OverlaySegment] = field(default_factory=list)
@@ -81,6 +81,9 @@ class Visualizer:
         rotate_with_robot: bool = False,
         camera_lag: float = 0.15,
         zoom_limits: Optional[Tuple[float, float]] = None,
+        realtime: bool = False,
+        max_steps_per_frame: int = 5,
+        dirty_rects: bool = False,
     ) -> None:
         pygame.init()
         pygame.display.set_caption("Robotics Simulation Visualizer")
@@ -98,6 +101,20 @@ class Visualizer:
         self.background_color = background_color
         self.target_fps = target_fps
         self.sim_dt = sim_dt
+        # realtime=True steps physics by elapsed wall time (up to max_steps_per_frame
+        # per frame) instead of once per frame, so a slow draw no longer slows the sim.
+        self.realtime = realtime
+        self.max_steps_per_frame = max(1, int(max_steps_per_frame))
+        # dirty_rects=True pushes only the regions drawn this frame or last frame
+        # while the camera holds still; any camera change falls back to flip().
+        # It also keeps the leading run of static objects pre-rendered, so a still
+        # camera only repaints what was drawn over that layer last frame.
+        self.dirty_rects = dirty_rects
+        self._frame_rects: List[pygame.Rect] = []
+        self._last_rects: Optional[List[pygame.Rect]] = None
+        self._last_view: Optional[Tuple[Any, ...]] = None
+        self._static_layer: Optional[pygame.Surface] = None
+        self._static_key: Optional[Tuple[Any, ...]] = None
         self._font = pygame.font.SysFont("Arial", 16)
         self._clock = pygame.time.Clock()
         self.camera_mode = self.CAMERA_ROBOT
@@ -107,6 +124,10 @@ class Visualizer:
         self._camera_pos: Point = (0.0, 0.0)
         self._camera_target_pos: Point = (0.0, 0.0)
         self._camera_angle: float = 0.0
+        self._camera_trig: Tuple[float, float, float] = (0.0, 1.0, -0.0)
+        self._color_cache: Dict[Tuple[Any, bool], Color] = {}
+        self._robot_names: List[str] = []
+        self._robot_names_key: Optional[Tuple[World, int]] = None
         self._camera_target_angle: float = 0.0
         self._component_viz = ComponentVisualizer(self.surface)
         self._component_toggles = ComponentToggleState()
@@ -127,6 +148,7 @@ class Visualizer:
         running = True
         show_help = False
         dt = self.sim_dt or world.default_dt
+        pending_time = 0.0
 
         while running:
             robot_cycle = self._collect_robot_names(world)
@@ -172,17 +194,27 @@ class Visualizer:
                     elif event.key == pygame.K_n:
                         self.show_numeric_labels = not self.show_numeric_labels
 
-            should_step = (not paused) or step_once
-            if should_step:
+            steps = 0
+            if step_once:
+                steps = 1
+            elif not paused:
+                steps = 1
+                if self.realtime:
+                    steps = min(int(pending_time / dt), self.max_steps_per_frame)
+                    # Drop the backlog beyond the cap rather than spiralling.
+                    pending_time = 0.0 if steps == self.max_steps_per_frame else pending_time - steps * dt
+            for _ in range(steps):
                 if step_callback:
                     step_callback(world, dt)
                 world.step(dt)
-                step_once = False
+            step_once = False
 
             overlays = overlay_provider(world) if overlay_provider else None
             self._draw_frame(world, overlays, paused, instructions, show_help)
-            pygame.display.flip()
-            self._clock.tick(self.target_fps)
+            self._present_frame()
+            elapsed = self._clock.tick(self.target_fps) / 1000.0
+            if self.realtime and not paused:
+                pending_time += elapsed
 
         pygame.quit()
 
@@ -194,66 +226,102 @@ class Visualizer:
         instructions: Sequence[str],
         show_help: bool,
     ) -> None:
-        self.surface.fill(self.background_color)
+        self._frame_rects = []
         self._update_camera(world)
         self._component_toggles = ComponentToggleState(
             icons=self.show_components,
             sensor_details=self.show_sensor_details,
             numeric_labels=self.show_numeric_labels,
         )
-        for obj in world:
+        objects = list(world)
+        start = 0
+        if self.dirty_rects:
+            start = self._draw_static_layer(objects)
+        else:
+            self.surface.fill(self.background_color)
+        for obj in objects[start:]:
             self._draw_object(obj)
         if overlays:
             self._draw_overlays(overlays)
         self._draw_status(world, paused, instructions, show_help)
 
+    def _draw_static_layer(self, objects: Sequence[Any]) -> int:
+        """Put the background and the leading static objects on screen; returns how many were covered.
+
+        Only immovable objects without components, drawn before any other object, go in
+        the layer, so reusing it never changes how objects stack. While the camera and
+        those objects are unchanged, only last frame's rects are restored from the layer.
+        """
+        count = 0
+        entries = []
+        for obj in objects:
+            if obj.can_move or obj.components:
+                break
+            entries.append((obj, obj.pose, obj.shape, self._resolve_color(obj)))
+            count += 1
+        view = self._view_key()
+        key = (view, self.background_color, tuple(entries))
+        layer = self._static_layer
+        if layer is not None and view == self._last_view and key == self._static_key and self._last_rects is not None:
+            surface = self.surface
+            for rect in self._last_rects:
+                surface.blit(layer, rect, rect)
+            return count
+        self.surface.fill(self.background_color)
+        for obj in objects[:count]:
+            self._draw_object(obj)
+        if view == self._last_view:
+            # Built on the second still frame, so a moving camera never pays for the copy.
+            self._static_layer = self.surface.copy()
+            self._static_key = key
+        else:
+            self._static_layer = None
+            self._static_key = None
+        return count
+
     def _draw_object(self, obj) -> None:
         color = self._resolve_color(obj)
         if isinstance(obj.shape, Circle):
             center_px = self._world_to_screen((obj.pose.x, obj.pose.y))
             radius_px = max(1, int(obj.shape.radius * self.scale))
-            pygame.draw.circle(self.surface, color, center_px, radius_px, 0)
+            self._frame_rects.append(pygame.draw.circle(self.surface, color, center_px, radius_px, 0))
             if obj.can_move:
                 heading = obj.pose.transform_point((obj.shape.radius, 0.0))
-                pygame.draw.line(
-                    self.surface,
-                    (255, 255, 255),
-                    center_px,
-                    self._world_to_screen(heading),
-                    2,
-                )
+                heading_px = self._world_to_screen(heading)
+                self._frame_rects.append(pygame.draw.line(self.surface, (255, 255, 255), center_px, heading_px, 2))
         elif isinstance(obj.shape, Polygon):
-            points = [self._world_to_screen(obj.pose.transform_point(v)) for v in obj.shape.vertices]
-            pygame.draw.polygon(self.surface, color, points, 0)
+            points = self._world_to_screen_many(obj.pose.transform_points(obj.shape.vertices))
+            self._frame_rects.append(pygame.draw.polygon(self.surface, color, points, 0))
         else:
             bbox = obj.bounding_box()
             top_left = self._world_to_screen((bbox.min_x, bbox.max_y))
             width = max(1, int((bbox.max_x - bbox.min_x) * self.scale))
             height = max(1, int((bbox.max_y - bbox.min_y) * self.scale))
-            pygame.draw.rect(self.surface, color, (*top_left, width, height), 1)
-        self._component_viz.draw_for_object(
+            self._frame_rects.append(pygame.draw.rect(self.surface, color, (*top_left, width, height), 1))
+        dirty = self._component_viz.draw_for_object(
             obj,
             world_to_screen=self._world_to_screen,
             scale=self.scale,
             font=self._font,
             toggles=self._component_toggles,
         )
+        self._frame_rects.extend(dirty)
 
     def _draw_overlays(self, overlays: OverlayData) -> None:
+        # Overlays can carry hundreds of track segments; bind the per-item callables once.
+        surface = self.surface
+        world_to_screen = self._world_to_screen
+        draw_circle = pygame.draw.circle
+        draw_line = pygame.draw.line
+        mark = self._frame_rects.append
         for pt in overlays.points:
-            screen_pt = self._world_to_screen(pt.position)
-            pygame.draw.circle(self.surface, pt.color, screen_pt, pt.radius)
+            screen_pt = world_to_screen(pt.position)
+            mark(draw_circle(surface, pt.color, screen_pt, pt.radius))
             if pt.label:
                 text = self._font.render(pt.label, True, pt.color)
-                self.surface.blit(text, (screen_pt[0] + 6, screen_pt[1] - 12))
+                mark(surface.blit(text, (screen_pt[0] + 6, screen_pt[1] - 12)))
         for seg in overlays.segments:
-            pygame.draw.line(
-                self.surface,
-                seg.color,
-                self._world_to_screen(seg.start),
-                self._world_to_screen(seg.end),
-                seg.width,
-            )
+            mark(draw_line(surface, seg.color, world_to_screen(seg.start), world_to_screen(seg.end), seg.width))
 
     def _draw_status(
         self, world: World, paused: bool, instructions: Sequence[str], show_help: bool
@@ -263,7 +331,7 @@ class Visualizer:
             f"t={world.time:.2f}s  step={world.step_index}  "
             f"mode={'PAUSED' if paused else 'PLAYING'}  cam={cam_desc}"
         )
-        self.surface.blit(self._font.render(status, True, (240, 240, 240)), (8, 8))
+        self._frame_rects.append(self.surface.blit(self._font.render(status, True, (240, 240, 240)), (8, 8)))
         base_y = 30
         if show_help:
             help_lines = [
@@ -283,15 +351,37 @@ class Visualizer:
         else:
             help_lines = ["H: show controls"]
         for line in help_lines:
-            self.surface.blit(self._font.render(line, True, (200, 200, 200)), (8, base_y))
+            self._frame_rects.append(self.surface.blit(self._font.render(line, True, (200, 200, 200)), (8, base_y)))
             base_y += 18
 
+    def _present_frame(self) -> None:
+        rects = self._frame_rects
+        view = self._view_key()
+        if not self.dirty_rects or self._last_rects is None or view != self._last_view:
+            pygame.display.flip()
+        else:
+            # Last frame's rects must be repainted too, to erase what moved away.
+            pygame.display.update(merge_or_fullscreen(self._last_rects + rects, self.surface.get_rect()))
+        self._last_rects = rects
+        self._last_view = view
+
+    def _view_key(self) -> Tuple[Any, ...]:
+        return (self._camera_pos, self._camera_angle, self.scale, self.rotate_with_robot)
+
+    def _camera_rotation(self) -> Tuple[float, float]:
+        """``(cos, sin)`` of the inverse camera angle, recomputed only when the angle changes."""
+        angle = self._camera_angle
+        cached = self._camera_trig
+        if cached[0] != angle:
+            cached = (angle, math.cos(-angle), math.sin(-angle))
+            self._camera_trig = cached
+        return cached[1], cached[2]
+
     def _world_to_screen(self, point: Point) -> Tuple[int, int]:
         px = point[0] - self._camera_pos[0]
         py = point[1] - self._camera_pos[1]
         if self.rotate_with_robot and self._camera_angle:
-            cos_t = math.cos(-self._camera_angle)
-            sin_t = math.sin(-self._camera_angle)
+            cos_t, sin_t = self._camera_rotation()
             px, py = (
                 px * cos_t - py * sin_t,
                 px * sin_t + py * cos_t,
@@ -300,8 +390,30 @@ class Visualizer:
         y = self.base_center[1] - py * self.scale
         return int(x), int(y)
 
+    def _world_to_screen_many(self, points: Iterable[Point]) -> List[Tuple[int, int]]:
+        """Batch form of ``_world_to_screen``: camera terms are read once, results identical."""
+        cam_x, cam_y = self._camera_pos
+        base_x, base_y = self.base_center
+        scale = self.scale
+        if self.rotate_with_robot and self._camera_angle:
+            cos_t, sin_t = self._camera_rotation()
+            screen = []
+            for x, y in points:
+                px = x - cam_x
+                py = y - cam_y
+                px, py = (px * cos_t - py * sin_t, px * sin_t + py * cos_t)
+                screen.append((int(base_x + px * scale), int(base_y - py * scale)))
+            return screen
+        return [(int(base_x + (x - cam_x) * scale), int(base_y - (y - cam_y) * scale)) for x, y in points]
+
     def _collect_robot_names(self, world: World) -> List[str]:
-        return [obj.name for obj in world if getattr(obj, "can_move", False)]
+        # Rescanned only after add_object/remove_object bumps the world's version.
+        key = self._robot_names_key
+        version = world._objects_version
+        if key is None or key[0] is not world or key[1] != version:
+            self._robot_names = [obj.name for obj in world if getattr(obj, "can_move", False)]
+            self._robot_names_key = (world, version)
+        return self._robot_names
 
     def _get_follow_robot(self, world: World):
         if not self.follow_robot_name:
@@ -360,6 +472,23 @@ class Visualizer:
         raw = obj.material.custom.get("color") if hasattr(obj.material, "custom") else None
         if raw is None:
             raw = obj.metadata.get("color") if hasattr(obj, "metadata") else None
+        # The raw value is re-read every frame, so edits take effect at once; only the
+        # conversion (ABC isinstance, clamping) is memoized, keyed by value.
+        can_move = bool(getattr(obj, "can_move", False))
+        try:
+            key = (tuple(raw) if type(raw) is list else raw, can_move)
+            return self._color_cache[key]
+        except KeyError:
+            color = self._convert_color(raw, can_move)
+            if len(self._color_cache) >= 256:
+                self._color_cache.clear()
+            self._color_cache[key] = color
+            return color
+        except TypeError:  # unhashable raw value
+            return self._convert_color(raw, can_move)
+
+    @staticmethod
+    def _convert_color(raw: Any, can_move: bool) -> Color:
         color: Optional[Color]
         if isinstance(raw, str):
             color = NAMED_COLORS.get(raw.lower())
@@ -368,8 +497,22 @@ class Visualizer:
         else:
             color = None
         if color is None:
-            color = DEFAULT_COLORS["movable" if getattr(obj, "can_move", False) else "default"]
+            color = DEFAULT_COLORS["movable" if can_move else "default"]
         return color
 
 
+def merge_or_fullscreen(rects: Sequence[pygame.Rect], screen_rect: pygame.Rect) -> List[pygame.Rect]:
+    """Return ``rects`` for ``display.update``, or just the screen once they add up to its area.
+
+    Past that point, updating many small regions costs more than one full present.
+    """
+    screen_area = screen_rect.width * screen_rect.height
+    total = 0
+    for rect in rects:
+        total += rect.width * rect.height
+        if total >= screen_area:
+            return [screen_rect]
+    return list(rects)
+
+
 __all__ = ["Visualizer", "OverlayData", "OverlayPoint", "OverlaySegment"]
@@ -1,22 +1,24 @@
 """World- and transform-level primitives for the simulation environment."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import math
+import operator
 import random
-from typing import Dict, Iterable, Iterator, MutableMapping, Optional, Tuple, TYPE_CHECKING
+from typing import Dict, Iterable, Iterator, List, MutableMapping, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover - only for static analyzers
     from .entities import SimObject
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Pose2D:
     """A 2D pose with translation (meters) and rotation (radians)."""
 
     x: float
     y: float
     theta: float = 0.0
+    _rotation: Optional[Tuple[float, float]] = field(default=None, init=False, repr=False, compare=False)
 
     def translated(self, dx: float = 0.0, dy: float = 0.0) -> "Pose2D":
         return Pose2D(self.x + dx, self.y + dy, self.theta)
@@ -24,22 +26,43 @@ class Pose2D:
     def rotated(self, dtheta: float) -> "Pose2D":
         return Pose2D(self.x, self.y, self.theta + dtheta)
 
+    @property
+    def rotation(self) -> Tuple[float, float]:
+        """``(cos(theta), sin(theta))``, computed once per pose instance."""
+        rotation = self._rotation
+        if rotation is None:
+            rotation = (math.cos(self.theta), math.sin(self.theta))
+            object.__setattr__(self, "_rotation", rotation)
+        return rotation
+
     def transform_point(self, point: Tuple[float, float]) -> Tuple[float, float]:
         px, py = point
-        cos_t = math.cos(self.theta)
-        sin_t = math.sin(self.theta)
+        cos_t, sin_t = self.rotation
         return (
             self.x + cos_t * px - sin_t * py,
             self.y + sin_t * px + cos_t * py,
         )
 
+    def transform_points(self, points: Iterable[Tuple[float, float]]) -> List[Tuple[float, float]]:
+        """Batch form of ``transform_point``: one sin/cos for the whole sequence, identical results."""
+        x = self.x
+        y = self.y
+        cos_t, sin_t = self.rotation
+        return [(x + cos_t * px - sin_t * py, y + sin_t * px + cos_t * py) for px, py in points]
+
     def compose(self, other: "Pose2D") -> "Pose2D":
-        tx, ty = self.transform_point((other.x, other.y))
-        return Pose2D(tx, ty, self.theta + other.theta)
+        # transform_point inlined; same arithmetic without the intermediate tuples.
+        cos_t, sin_t = self.rotation
+        ox = other.x
+        oy = other.y
+        return Pose2D(
+            self.x + cos_t * ox - sin_t * oy,
+            self.y + sin_t * ox + cos_t * oy,
+            self.theta + other.theta,
+        )
 
     def inverse(self) -> "Pose2D":
-        cos_t = math.cos(self.theta)
-        sin_t = math.sin(self.theta)
+        cos_t, sin_t = self.rotation
         ix = -self.x * cos_t - self.y * sin_t
         iy = self.x * sin_t - self.y * cos_t
         return Pose2D(ix, iy, -self.theta)
@@ -51,7 +74,7 @@ class Pose2D:
         return {"x": self.x, "y": self.y, "theta": self.theta}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Transform2D:
     """Convenience wrapper for repeatedly applying the same transform."""
 
@@ -82,6 +105,46 @@ class Transform2D:
         return Pose2D(x, y, pose.theta + self.rotation)
 
 
+# Below this many solids the plain box scan in World._resolve_collisions beats building a grid.
+_GRID_MIN_SOLIDS = 64
+
+
+class _SolidGrid:
+    """Uniform hash grid mapping cells to the slots of solids whose boxes cover them."""
+
+    def __init__(self, cell_size: float) -> None:
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+
+    def _span(self, min_x: float, min_y: float, max_x: float, max_y: float) -> Tuple[int, int, int, int]:
+        size = self.cell_size
+        return (
+            math.floor(min_x / size),
+            math.floor(min_y / size),
+            math.floor(max_x / size),
+            math.floor(max_y / size),
+        )
+
+    def insert(self, slot: int, min_x: float, min_y: float, max_x: float, max_y: float) -> None:
+        x0, y0, x1, y1 = self._span(min_x, min_y, max_x, max_y)
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cells.setdefault((cx, cy), []).append(slot)
+
+    def query(self, min_x: float, min_y: float, max_x: float, max_y: float) -> set:
+        """Slots sharing a cell with the box; callers still run the exact box test."""
+        x0, y0, x1, y1 = self._span(min_x, min_y, max_x, max_y)
+        cells = self.cells
+        candidates: set = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    candidates.update(bucket)
+        return candidates
+
+
 class World:
     """Owns simulation objects and deterministic randomness."""
 
@@ -101,6 +164,9 @@ class World:
         self.random_seed = random_seed
         self._rng = random.Random(random_seed)
         self.metadata: MutableMapping[str, object] = metadata or {}
+        # Bumped whenever the object set changes, so per-frame views of it can be cached.
+        self._objects_version: int = 0
+        self._solid_grid_cache: Optional[Tuple[List[object], Dict[int, Tuple["SimObject", float, float, float, float]], _SolidGrid]] = None
 
     @property
     def rng(self) -> random.Random:
@@ -112,10 +178,12 @@ class World:
         if obj.name in self._objects and overwrite:
             self._objects[obj.name].on_removed_from_world()
         self._objects[obj.name] = obj
+        self._objects_version += 1
         obj.on_added_to_world(self)
 
     def remove_object(self, name: str) -> None:
         obj = self._objects.pop(name)
+        self._objects_version += 1
         obj.on_removed_from_world()
 
     def get_object(self, name: str) -> "SimObject":
@@ -126,10 +194,13 @@ class World:
 
     def step(self, dt: Optional[float] = None) -> None:
         dt = self.default_dt if dt is None else dt
-        prev_poses = {name: obj.pose for name, obj in self._objects.items()}
-        for obj in self._objects.values():
+        # One snapshot of the object table serves integration and collision handling.
+        objects = tuple(self._objects.values())
+        # Only movable objects can be rewound, so only they need a pre-step pose.
+        movers = [(obj, obj.pose) for obj in objects if obj.can_move]
+        for obj in objects:
             obj.integrate(dt)
-        self._resolve_collisions(prev_poses)
+        self._resolve_collisions(objects, movers)
         self.time += dt
         self.step_index += 1
 
@@ -158,17 +229,41 @@ class World:
 
     # --- Collision helpers -------------------------------------------------
 
-    def _resolve_collisions(self, prev_poses: Dict[str, Pose2D]) -> None:
-        solids = [obj for obj in self._objects.values() if self._object_is_solid(obj)]
+    def _resolve_collisions(
+        self,
+        objects: Tuple["SimObject", ...],
+        movers: List[Tuple["SimObject", Pose2D]],
+    ) -> None:
+        # integrate() keeps the Pose2D of a body that did not move; such a body has
+        # zero velocity and nothing to rewind, so only bodies with a new pose are checked.
+        moved = [(obj, prev_pose) for obj, prev_pose in movers if obj.pose is not prev_pose]
+        if not moved:
+            return
+        solids = [obj for obj in objects if self._object_is_solid(obj)]
         if not solids:
             return
-        for name, obj in self._objects.items():
-            if not obj.can_move:
-                continue
-            prev_pose = prev_poses.get(name)
-            if prev_pose is None:
-                continue
-            for solid in solids:
+        # Broad phase: one box per solid per step, then a plain tuple overlap test so
+        # only pairs whose boxes touch pay for the shape-level intersects() call.
+        if len(solids) < _GRID_MIN_SOLIDS:
+            solid_boxes = [self._box_entry(solid) for solid in solids]
+            grid = None
+            mobile_slots: List[int] = []
+        else:
+            solid_boxes, grid, mobile_slots = self._solid_grid(solids, moved)
+        solid_slots = {id(solid): index for index, solid in enumerate(solids)}
+        for obj, prev_pose in moved:
+            box = obj.shape.bounding_box(obj.pose)
+            min_x, min_y, max_x, max_y = box.min_x, box.min_y, box.max_x, box.max_y
+            if grid is None:
+                candidates: Iterable[Tuple["SimObject", float, float, float, float]] = solid_boxes
+            else:
+                # Sorted slots keep the linear scan's visiting order, so the first hit is unchanged.
+                slots = grid.query(min_x, min_y, max_x, max_y)
+                slots.update(mobile_slots)
+                candidates = [solid_boxes[slot] for slot in sorted(slots)]
+            for solid, s_min_x, s_min_y, s_max_x, s_max_y in candidates:
+                if max_x < s_min_x or min_x > s_max_x or max_y < s_min_y or min_y > s_max_y:
+                    continue
                 if solid is obj:
                     continue
                 if not obj.shape.intersects(solid.shape, obj.pose, solid.pose):
@@ -176,8 +271,60 @@ class World:
                 self._rewind_to_contact(obj, prev_pose, solid)
                 obj.state.linear_velocity = (0.0, 0.0)
                 obj.state.angular_velocity = 0.0
+                slot = solid_slots.get(id(obj))
+                if slot is not None:
+                    # A movable solid was just rewound; later bodies must see its new box.
+                    solid_boxes[slot] = self._box_entry(obj)
                 break
 
+    def _solid_grid(
+        self,
+        solids: List["SimObject"],
+        moved: List[Tuple["SimObject", Pose2D]],
+    ) -> Tuple[List[Tuple["SimObject", float, float, float, float]], "_SolidGrid", List[int]]:
+        """Box entries for ``solids``, a hash grid over the immovable ones, and the movable slots.
+
+        Immovable solids only change through add/remove/set_pose, so the grid and their
+        boxes are reused until the solid list or one of their shapes or poses changes.
+        Movable solids stay out of the grid and are checked against every moved body.
+        """
+        signature: List[object] = []
+        for solid in solids:
+            signature.append(solid)
+            signature.append(None if solid.can_move else solid.shape)
+            signature.append(None if solid.can_move else solid.pose)
+        cached = self._solid_grid_cache
+        if cached is None or len(cached[0]) != len(signature) or not all(map(operator.is_, cached[0], signature)):
+            # Cells about twice the largest moved body keep each query to a handful of buckets.
+            extent = 0.0
+            for obj, _ in moved:
+                box = obj.shape.bounding_box(obj.pose)
+                extent = max(extent, box.max_x - box.min_x, box.max_y - box.min_y)
+            grid = _SolidGrid(max(2.0 * extent, 0.05))
+            static_boxes: Dict[int, Tuple["SimObject", float, float, float, float]] = {}
+            for slot, solid in enumerate(solids):
+                if not solid.can_move:
+                    entry = self._box_entry(solid)
+                    static_boxes[slot] = entry
+                    grid.insert(slot, *entry[1:])
+            cached = (signature, static_boxes, grid)
+            self._solid_grid_cache = cached
+        _, static_boxes, grid = cached
+        solid_boxes = []
+        mobile_slots = []
+        for slot, solid in enumerate(solids):
+            entry = static_boxes.get(slot)
+            if entry is None:
+                entry = self._box_entry(solid)
+                mobile_slots.append(slot)
+            solid_boxes.append(entry)
+        return solid_boxes, grid, mobile_slots
+
+    @staticmethod
+    def _box_entry(obj: "SimObject") -> Tuple["SimObject", float, float, float, float]:
+        box = obj.shape.bounding_box(obj.pose)
+        return (obj, box.min_x, box.min_y, box.max_x, box.max_y)
+
     @staticmethod
     def _object_is_solid(obj: "SimObject") -> bool:
         metadata = getattr(obj, "metadata", {}) or {}
@@ -192,16 +339,58 @@ class World:
         end = obj.pose
         if not obj.shape.intersects(solid.shape, end, solid.pose):
             return
+        from .geometry import Circle  # geometry imports this module
+
+        if isinstance(obj.shape, Circle) and isinstance(solid.shape, Circle):
+            t = self._circle_time_of_impact(start, end, solid.pose, obj.shape.radius + solid.shape.radius)
+            if t is not None:
+                pose = self._lerp_pose(start, end, t)
+                if t == 0.0 or not obj.shape.intersects(solid.shape, pose, solid.pose):
+                    obj.set_pose(pose)
+                    return
+        # Same interpolation as _lerp_pose, with the deltas hoisted out of the bisection.
+        sx, sy, st = start.x, start.y, start.theta
+        dx = end.x - sx
+        dy = end.y - sy
+        dtheta = (end.theta - st + math.pi) % (2 * math.pi) - math.pi
+        intersects = obj.shape.intersects
+        solid_shape = solid.shape
+        solid_pose = solid.pose
         low = 0.0
         high = 1.0
         for _ in range(12):
             mid = 0.5 * (low + high)
-            test_pose = self._lerp_pose(start, end, mid)
-            if obj.shape.intersects(solid.shape, test_pose, solid.pose):
+            if intersects(solid_shape, Pose2D(sx + dx * mid, sy + dy * mid, st + dtheta * mid), solid_pose):
                 high = mid
             else:
                 low = mid
-        obj.set_pose(self._lerp_pose(start, end, low))
+        obj.set_pose(Pose2D(sx + dx * low, sy + dy * low, st + dtheta * low))
+
+    @staticmethod
+    def _circle_time_of_impact(start: Pose2D, end: Pose2D, center: Pose2D, radius_sum: float) -> Optional[float]:
+        """Fraction of the ``start``->``end`` sweep at which two circles first touch.
+
+        Solves ``|p0 + t*d|^2 = radius_sum^2`` for the smaller root, nudged just short
+        of contact so the returned pose no longer intersects. ``None`` means no root.
+        """
+        px = start.x - center.x
+        py = start.y - center.y
+        dx = end.x - start.x
+        dy = end.y - start.y
+        c = px * px + py * py - radius_sum * radius_sum
+        if c <= 0.0:
+            return 0.0
+        a = dx * dx + dy * dy
+        if a == 0.0:
+            return None
+        b = 2.0 * (px * dx + py * dy)
+        disc = b * b - 4.0 * a * c
+        if disc < 0.0:
+            return None
+        t = (-b - math.sqrt(disc)) / (2.0 * a)
+        if not 0.0 <= t <= 1.0:
+            return None
+        return t * (1.0 - 1e-9)
 
     @staticmethod
     def _lerp_pose(start: Pose2D, end: Pose2D, alpha: float) -> Pose2D:
@@ -4,7 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 import math
 import random
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from low_level_mechanics.world import Pose2D, World
 from low_level_mechanics.entities import SimObject
@@ -39,6 +39,8 @@ class SensorReading:
 class MountedComponent:
     """Base class for things that mount onto a SimObject."""
 
+    _world_pose_cache: Optional[Tuple[Pose2D, Pose2D, Pose2D]] = None
+
     def __init__(self, name: str, mount_pose: Pose2D | None = None) -> None:
         self.name = name
         self.mount_pose = mount_pose or Pose2D(0.0, 0.0, 0.0)
@@ -60,7 +62,16 @@ class MountedComponent:
     def world_pose(self) -> Pose2D:
         if self.parent is None:
             return self.mount_pose
-        return self.parent.pose.compose(self.mount_pose)
+        # Sensors, motors and the visualizer all ask within the same step; poses are
+        # immutable, so the last result holds while both input objects are unchanged.
+        parent_pose = self.parent.pose
+        mount_pose = self.mount_pose
+        cached = self._world_pose_cache
+        if cached is not None and cached[0] is parent_pose and cached[1] is mount_pose:
+            return cached[2]
+        pose = parent_pose.compose(mount_pose)
+        self._world_pose_cache = (parent_pose, mount_pose, pose)
+        return pose
 
     @property
     def visual_tag(self) -> Optional[str]:
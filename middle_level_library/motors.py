@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import math
 from typing import Optional
 
 from low_level_mechanics.world import Pose2D, World
@@ -185,8 +184,8 @@ class WheelMotor(Motor):
     def _apply(self, value: float, world: World, dt: float) -> None:
         if not self.parent or not self.parent.can_move:
             return
-        pose = self.parent.pose.compose(self.mount_pose)
-        direction = (math.cos(pose.theta), math.sin(pose.theta))
+        pose = self.world_pose()
+        direction = pose.rotation
         normal_load = self.normal_force
         if normal_load is None:
             normal_load = self.parent.state.mass * self.g_equiv / float(max(self.wheel_count, 1))
@@ -265,8 +264,8 @@ class WheelMotorDetailed(Motor):
         if not self.parent or not self.parent.can_move:
             return
         torque = self.preset.max_torque * value
-        heading = self.parent.pose.compose(self.mount_pose)
-        direction = (math.cos(heading.theta), math.sin(heading.theta))
+        heading = self.world_pose()
+        direction = heading.rotation
         normal_load = self.preset.normal_force
         if normal_load is None:
             normal_load = self.parent.state.mass * self.preset.g_equiv / float(max(self.preset.wheel_count, 1))
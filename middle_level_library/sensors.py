@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import math
 from typing import Dict, List, Optional
 
 from low_level_mechanics.world import Pose2D, World
@@ -12,6 +11,10 @@ from .base import NoiseProfile, Sensor, SensorReading
 from .presets import LINE_SENSOR_PRESETS, LineSensorPreset, DISTANCE_SENSOR_PRESETS, DistanceSensorPreset
 
 
+# Padding for ray/AABB rejection so rounding between world and local frames never drops a real hit.
+_RAY_BOX_EPS = 1e-9
+
+
 def _clamp(value: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, value))
 
@@ -125,12 +128,8 @@ class LineSensorArray(Sensor):
     def sample_points_world(self) -> List[tuple[float, float]]:
         if not self.parent:
             return []
-        base_pose = self.parent.pose.compose(self.mount_pose)
-        points: List[tuple[float, float]] = []
-        for offset in self._offsets:
-            pose = base_pose.compose(offset)
-            points.append((pose.x, pose.y))
-        return points
+        # Only positions are needed, so skip building a composed Pose2D per offset.
+        return self.world_pose().transform_points([(offset.x, offset.y) for offset in self._offsets])
 
     @property
     def visual_tag(self) -> str:
@@ -170,7 +169,7 @@ class DistanceSensor(Sensor):
         if not self.parent or not self.should_update(dt):
             return None
         pose = self.world_pose()
-        direction = (math.cos(pose.theta), math.sin(pose.theta))
+        direction = pose.rotation
         hit_distance = self._ray_march(world, (pose.x, pose.y), direction)
         value = self.preset.max_range if hit_distance is None else hit_distance
         value += self.noise.sample(world)
@@ -190,16 +189,32 @@ class DistanceSensor(Sensor):
         origin: tuple[float, float],
         direction: tuple[float, float],
     ) -> Optional[float]:
+        max_range = self.preset.max_range
+        ox, oy = origin
+        dx, dy = direction
+        # Broad phase: only bodies whose AABB touches the ray's sweep can contain a sample point.
+        ex = ox + dx * max_range
+        ey = oy + dy * max_range
+        ray_min_x, ray_max_x = min(ox, ex) - _RAY_BOX_EPS, max(ox, ex) + _RAY_BOX_EPS
+        ray_min_y, ray_max_y = min(oy, ey) - _RAY_BOX_EPS, max(oy, ey) + _RAY_BOX_EPS
+        candidates = []
+        for obj in world:
+            if obj is self.parent:
+                continue
+            box = obj.bounding_box()
+            if box.max_x < ray_min_x or box.min_x > ray_max_x or box.max_y < ray_min_y or box.min_y > ray_max_y:
+                continue
+            candidates.append((box.min_x - _RAY_BOX_EPS, box.min_y - _RAY_BOX_EPS, box.max_x + _RAY_BOX_EPS, box.max_y + _RAY_BOX_EPS, obj))
+        if not candidates:
+            return None
         distance = 0.0
-        while distance <= self.preset.max_range:
-            sample_point = (
-                origin[0] + direction[0] * distance,
-                origin[1] + direction[1] * distance,
-            )
-            for obj in world:
-                if obj.shape.contains_point(sample_point, obj.pose):
-                    if obj is self.parent:
-                        continue
+        while distance <= max_range:
+            px = ox + dx * distance
+            py = oy + dy * distance
+            for min_x, min_y, max_x, max_y, obj in candidates:
+                if px < min_x or px > max_x or py < min_y or py > max_y:
+                    continue
+                if obj.shape.contains_point((px, py), obj.pose):
                     return distance
             distance += self.preset.step
         return None
@@ -212,7 +227,7 @@ class DistanceSensor(Sensor):
         if not self.parent:
             return None
         pose = self.world_pose()
-        direction = (math.cos(pose.theta), math.sin(pose.theta))
+        direction = pose.rotation
         reading = self.last_reading
         distance = reading.value if reading else self.preset.max_range
         end = (pose.x + direction[0] * distance, pose.y + direction[1] * distance)
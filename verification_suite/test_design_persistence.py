@@ -1,9 +1,22 @@
 """Verify designer design save/load helpers for robot, environment, custom assets."""
 from __future__ import annotations
 
+from array import array
+import json
 from pathlib import Path
 
-from core.config import BodyConfig, WorldConfig, RobotConfig, CustomObjectConfig, MaterialConfig
+from core.config import (
+    ActuatorConfig,
+    BodyConfig,
+    WorldConfig,
+    RobotConfig,
+    CustomObjectConfig,
+    MaterialConfig,
+    SensorConfig,
+    SnapshotState,
+    StrokeConfig,
+    WorldObjectConfig,
+)
 from core.persistence import (
     save_robot_design,
     load_robot_design,
@@ -13,6 +26,8 @@ from core.persistence import (
     load_custom_asset,
     save_scenario,
     load_scenario,
+    save_snapshot,
+    load_snapshot,
 )
 
 
@@ -47,6 +62,24 @@ def test_robot_design_inserts_default_body_when_empty(tmp_path: Path) -> None:
     assert loaded.bodies[0].points, "default body should define geometry"
 
 
+def test_robot_design_resorts_devices_appended_without_mark_modified(tmp_path: Path) -> None:
+    robot = RobotConfig(
+        actuators=[ActuatorConfig(name="motor_b", type="motor", body="body")],
+        sensors=[SensorConfig(name="line_b", type="line", body="body")],
+    )
+    path = _tmp(tmp_path, "robot")
+    save_robot_design(path, robot)
+    loaded = load_robot_design(path)
+    # In-place edits that skip mark_modified(), as a script or importer might do.
+    loaded.actuators.append(ActuatorConfig(name="motor_a", type="motor", body="body"))
+    loaded.sensors.append(SensorConfig(name="line_a", type="line", body="body"))
+    save_robot_design(path, loaded)
+    # Check the file itself: loading re-sorts, which would hide an unsorted save.
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    assert [a["name"] for a in saved["actuators"]] == ["motor_a", "motor_b"]
+    assert [s["name"] for s in saved["sensors"]] == ["line_a", "line_b"]
+
+
 def test_environment_design_roundtrip(tmp_path: Path) -> None:
     world = WorldConfig(drawings=[], bounds=None, metadata={"note": "env"})
     path = _tmp(tmp_path, "env")
@@ -56,6 +89,32 @@ def test_environment_design_roundtrip(tmp_path: Path) -> None:
     assert loaded.drawings == []
 
 
+def test_environment_design_resorts_strokes_edited_in_place(tmp_path: Path) -> None:
+    world = WorldConfig(
+        drawings=[
+            StrokeConfig(points=[(0.0, 0.0), (1.0, 0.0)]),
+            StrokeConfig(points=[(0.5, 0.0), (1.0, 0.0)]),
+        ],
+        shape_objects=[
+            WorldObjectConfig(
+                name="block",
+                body=BodyConfig(name="block", points=[(0.0, 0.0), (0.1, 0.0), (0.1, 0.1)], edges=[(0, 1), (1, 2), (2, 0)]),
+            )
+        ],
+    )
+    path = _tmp(tmp_path, "env")
+    save_environment_design(path, world)
+    # In-place point moves on the saved config, as the designer's drag handlers do, without mark_modified().
+    world.drawings[0].points[0] = (0.9, 0.0)
+    world.shape_objects[0].body.points[2] = (0, 1)
+    save_environment_design(path, world)
+    saved = path.read_text(encoding="utf-8")
+    # The moved stroke now sorts after the other one, and the int point is written as floats.
+    assert [d["points"][0] for d in json.loads(saved)["drawings"]] == [[0.5, 0.0], [0.9, 0.0]]
+    save_environment_design(path, load_environment_design(path))
+    assert path.read_text(encoding="utf-8") == saved
+
+
 def test_custom_asset_roundtrip(tmp_path: Path) -> None:
     body = BodyConfig(
         name="custom_body",
@@ -90,3 +149,13 @@ def test_scenario_creation_roundtrip(tmp_path: Path) -> None:
     assert loaded.world is not None
     assert loaded.robots, "scenario should contain at least one robot"
     assert loaded.robots[0].config.bodies, "robot should have bodies after load"
+
+
+def test_snapshot_preserves_binary_controller_state(tmp_path: Path) -> None:
+    state = {"gain": 0.5, "weights": array("d", [0.25, -1.5, 3.0]), "blob": b"\x00\xff"}
+    snap = SnapshotState(time=1.5, step=90, bodies={}, controller_state=state)
+    path = _tmp(tmp_path, "snap")
+    save_snapshot(path, snap)
+    loaded = load_snapshot(path)
+    assert loaded.controller_state == state
+    assert loaded.step == 90
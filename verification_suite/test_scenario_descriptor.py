@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 from pathlib import Path
+import os
 import sys
 
 BASE = Path(__file__).resolve().parents[1]
 if str(BASE) not in sys.path:
     sys.path.insert(0, str(BASE))
 
-from core import load_scenario, list_environment_assets, list_robot_assets
-from core.persistence import load_scenario_summary
+from core import (
+    load_scenario,
+    list_environment_assets,
+    list_robot_assets,
+    save_environment_design,
+    save_scenario_archive,
+)
+from core.persistence import _archive_member, load_scenario_summary
 
 
 def test_descriptor_parses_multi_robot() -> None:
@@ -67,3 +74,48 @@ def test_asset_helpers_list_shared_content() -> None:
     robots = list_robot_assets(BASE)
     assert any(p.name == "generic_world.json" for p in envs)
     assert any(p.name == "generic_robot.json" for p in robots)
+
+
+def test_asset_listing_tracks_directory_changes(tmp_path: Path) -> None:
+    env_dir = tmp_path / "assets" / "environments"
+    env_dir.mkdir(parents=True)
+    (env_dir / "a.json").write_text("{}", encoding="utf-8")
+    assert [p.name for p in list_environment_assets(tmp_path)] == ["a.json"]
+    (env_dir / "b.json").write_text("{}", encoding="utf-8")
+    (env_dir / "notes.txt").write_text("", encoding="utf-8")
+    assert [p.name for p in list_environment_assets(tmp_path)] == ["a.json", "b.json"]
+    assert list_robot_assets(tmp_path) == []
+
+
+def test_unchanged_save_leaves_file_untouched(tmp_path: Path) -> None:
+    world = load_scenario(BASE / "scenarios" / "composed_team_line").world
+    target = tmp_path / "world.json"
+    save_environment_design(target, world)
+    stale = target.stat().st_mtime_ns - 10**9
+    os.utime(target, ns=(stale, stale))
+    save_environment_design(target, world)
+    assert target.stat().st_mtime_ns == stale
+    world.seed = (world.seed or 0) + 1
+    world.mark_modified()
+    save_environment_design(target, world)
+    assert target.stat().st_mtime_ns != stale
+
+
+def test_scenario_archive_round_trip(tmp_path: Path) -> None:
+    source = load_scenario(BASE / "scenarios" / "composed_team_line")
+    archive = tmp_path / "packed.scnz"
+    save_scenario_archive(archive, source.world, source.robots[0].config)
+    loaded = load_scenario(archive)
+    assert loaded.descriptor.id == "packed"
+    assert len(loaded.robots) == 1
+    assert loaded.robots[0].config.bodies == source.robots[0].config.bodies
+    assert loaded.world.shape_objects == source.world.shape_objects
+
+
+def test_archive_member_keeps_dot_named_directories(tmp_path: Path) -> None:
+    members = {".assets/world.json": b"{}", "world.json": b"{}"}
+    archive = tmp_path / "packed.scnz"
+    assert _archive_member(members, ".assets/world.json", archive) == ".assets/world.json"
+    assert _archive_member(members, "./.assets/world.json", archive) == ".assets/world.json"
+    assert _archive_member(members, ".\\.assets\\world.json", archive) == ".assets/world.json"
+    assert _archive_member(members, "/world.json", archive) == "world.json"
@@ -0,0 +1,153 @@
+"""Solver options of the core Simulator on small hand-built body sets."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Tuple
+
+SIM_ENV_ROOT = Path(__file__).resolve().parents[1]
+if str(SIM_ENV_ROOT) not in sys.path:
+    sys.path.insert(0, str(SIM_ENV_ROOT))
+
+from core import Simulator  # noqa: E402
+from core.config import JointConfig  # noqa: E402
+from core.simulator import JointRuntime  # noqa: E402
+from low_level_mechanics.entities import DynamicState, SimObject  # noqa: E402
+from low_level_mechanics.geometry import Polygon  # noqa: E402
+from low_level_mechanics.world import Pose2D  # noqa: E402
+
+
+def _box(name: str, x: float, y: float = 0.0, *, half: float = 0.1, can_move: bool = True) -> SimObject:
+    return SimObject(
+        name=name,
+        pose=Pose2D(x, y, 0.0),
+        shape=Polygon([(-half, -half), (half, -half), (half, half), (-half, half)]),
+        can_move=can_move,
+        dynamic_state=DynamicState(mass=1.0, moment_of_inertia=0.1),
+    )
+
+
+def _top_down_sim() -> Simulator:
+    sim = Simulator()
+    sim.gravity = (0.0, 0.0)
+    return sim
+
+
+def test_sleeping_body_wakes_under_small_constant_force() -> None:
+    sim = _top_down_sim()
+    sim.sleep_velocity = 0.05
+    box = _box("box", 0.0)
+    sim.bodies["box"] = box
+    for _ in range(2 * sim.sleep_steps):
+        sim.step()
+    # A 1 N push on 1 kg adds far less than sleep_velocity per step; it must still accumulate.
+    for _ in range(600):
+        box.apply_force((1.0, 0.0))
+        sim.step()
+    assert box.state.linear_velocity[0] > 1.0
+    assert box.pose.x > 5.0
+
+
+def test_sleeping_zeroes_unforced_drift() -> None:
+    sim = _top_down_sim()
+    sim.sleep_velocity = 0.05
+    box = _box("box", 0.0)
+    box.state.linear_velocity = (0.01, 0.0)
+    sim.bodies["box"] = box
+    for _ in range(sim.sleep_steps + 2):
+        sim.step()
+    assert box.state.linear_velocity == (0.0, 0.0)
+
+
+def test_contact_position_modes_both_separate_overlapping_boxes() -> None:
+    for jacobi in (False, True):
+        sim = _top_down_sim()
+        sim.contact_jacobi_positions = jacobi
+        floor = _box("floor", 0.0, -0.3, half=0.2, can_move=False)
+        box = _box("box", 0.0, -0.05)  # 0.05 m into the floor's top face
+        sim.bodies["floor"] = floor
+        sim.bodies["box"] = box
+        for _ in range(120):
+            sim.step()
+        gap = (box.pose.y - 0.1) - (floor.pose.y + 0.2)
+        assert gap > -2.0 * sim.contact_slop, f"jacobi={jacobi}: still {-gap:.4f} m deep"
+        assert floor.pose.y == -0.3
+
+
+def test_replacing_a_body_under_its_name_reindexes() -> None:
+    sim = _top_down_sim()
+    sim.bodies["box"] = _box("box", 0.0)
+    sim.step()
+    replacement = _box("box", 1.0)
+    replacement.state.linear_velocity = (1.0, 0.0)
+    sim.bodies["box"] = replacement  # same name, same body count
+    sim.step()
+    assert replacement.pose.x > 1.0
+    assert list(sim) == [replacement]
+
+
+def test_invalidate_bodies_picks_up_can_move_change() -> None:
+    sim = _top_down_sim()
+    box = _box("box", 0.0, can_move=False)
+    box.state.linear_velocity = (1.0, 0.0)
+    sim.bodies["box"] = box
+    sim.step()
+    assert box.pose.x == 0.0
+    box.can_move = True
+    sim.invalidate_bodies()
+    sim.step()
+    assert box.pose.x > 0.0
+
+
+def _jointed_arm_sim(warm_start: float, x: float, y: float = 0.0) -> Tuple[Simulator, SimObject, JointConfig]:
+    sim = _top_down_sim()
+    sim.joint_warm_start = warm_start
+    sim.bodies["base"] = _box("base", 0.0, can_move=False)
+    arm = _box("arm", x, y)
+    sim.bodies["arm"] = arm
+    cfg = JointConfig(
+        name="j",
+        parent="base",
+        child="arm",
+        anchor_parent=(0.1, 0.0),
+        anchor_child=(-0.1, 0.0),
+        lower_limit=0.05,
+        upper_limit=0.05,
+    )
+    sim.joints.append(JointRuntime(cfg=cfg))
+    return sim, arm, cfg
+
+
+def _settled_joint_arm(warm_start: float) -> Pose2D:
+    # Anchors start 0.15 m apart, two whole max_correction steps from the 0.05 m the joint holds.
+    sim, arm, cfg = _jointed_arm_sim(warm_start, 0.35)
+    for _ in range(400):
+        sim.step()
+    anchor = arm.pose.transform_point(cfg.anchor_child)
+    assert abs(((anchor[0] - 0.1) ** 2 + anchor[1] ** 2) ** 0.5 - 0.05) < 1e-4
+    return arm.pose
+
+
+def test_joint_warm_start_converges_to_default_pose() -> None:
+    cold = _settled_joint_arm(0.0)
+    warm = _settled_joint_arm(0.5)
+    assert abs(warm.x - cold.x) < 1e-5
+    assert abs(warm.y - cold.y) < 1e-5
+    assert abs(warm.theta - cold.theta) < 1e-9
+
+
+def test_default_joint_solve_keeps_whole_correction_steps() -> None:
+    # Trajectory of the solver before joint_warm_start existed: with the error not a whole number of
+    # max_correction steps, the default solve keeps stepping across the target instead of stopping on it.
+    expected_x = [0.355279, 0.310558, 0.265837, 0.221116, 0.265835, 0.221115, 0.265834, 0.221113]
+    sim, arm, _ = _jointed_arm_sim(0.0, 0.4, 0.1)
+    for x in expected_x:
+        sim.step()
+        assert abs(arm.pose.x - x) < 1e-6
+    # Warm start stops on the target instead (see the remaining-error cap in _solve_joints).
+    sim, arm, _ = _jointed_arm_sim(0.5, 0.4, 0.1)
+    for _ in range(20):
+        sim.step()
+    settled = arm.pose
+    sim.step()
+    assert abs(arm.pose.x - settled.x) < 1e-5